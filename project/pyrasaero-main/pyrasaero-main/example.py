@@ -1,8 +1,12 @@
 import pyrasaero
 import os
-import csv
+import sys
 from time import sleep
 
+# The drag table lives with the analysis scripts in project/script
+sys.path.append(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "..", "script"))
+from drag_table import load_drag_table
+
 # Images of the interface for the simulation CV
 # Replace these with ones taken for the computer this is running on
 # Ensure the button to click is in the quadrant 1/9th from the left and 1/3rd from the top (see RASAero.exportAeroData for why)
@@ -12,6 +16,7 @@ ExportGUIImages = ["export-gui-0.png", "export-gui-1.png", "export-gui-2.png"]
 BaselineFilename = "example-base-parametric-model"
 
 MachNumberOfInterest = 3
+AngleOfAttackOfInterest__deg = 0
 
 # Set to "0" if you're not interested in modifying this value
 BodytubeDiameter__mm = 120
@@ -39,14 +44,9 @@ def main():
         # Required to give the file time to be written
         sleep(0.5)
         
-        with open(simOutputFullFilePath) as file:
-            reader = csv.DictReader(file)
-            
-            for row in reader:
-                if float(row["Mach"]) == MachNumberOfInterest:
-                    cd = float(row["CD"])
-                    print(f"Cd OF THE %iTH ITERATION AT MACH %f IS %s" % (i, MachNumberOfInterest, cd))
-                    break
+        # Interpolated on the Mach x Alpha grid, so the Mach number need not be one RASAero wrote out
+        cd = float(load_drag_table(simOutputFullFilePath).cd(MachNumberOfInterest, AngleOfAttackOfInterest__deg))
+        print(f"Cd OF THE %iTH ITERATION AT MACH %f IS %s" % (i, MachNumberOfInterest, cd))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,171 @@
+import glob
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from export_cache import load_openrocket_csv
+from flight_events import canonical_events
+
+
+class LoadReport:
+    """Timing and outcome of loading one export in a batch."""
+
+    def __init__(self, simulation_id: str, path: str, seconds: float, rows: int = 0, error: str = None) -> None:
+        """Initialise the LoadReport.
+
+        Args:
+            simulation_id (str): Key of the simulation in the stacked dataset
+            path (str): Path to the export
+            seconds (float): Wall time spent loading the export
+            rows (int, optional): Number of data rows loaded. Defaults to 0.
+            error (str, optional): Error message if the export could not be loaded. Defaults to None.
+        """
+        self.simulation_id = simulation_id
+        self.path = path
+        self.seconds = seconds
+        self.rows = rows
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """bool: Whether the export loaded without error."""
+        return self.error is None
+
+
+class BatchResult:
+    """Stacked dataset of many OpenRocket exports keyed by simulation ID."""
+
+    def __init__(self, data: pd.DataFrame, events: pd.DataFrame, reports: list) -> None:
+        """Initialise the BatchResult.
+
+        Args:
+            data (pd.DataFrame): Numeric rows of every export, indexed by (Simulation, row)
+            events (pd.DataFrame): Canonical events of every export with a 'Simulation' column
+            reports (list): LoadReport of each export in input order
+        """
+        self.data = data
+        self.events = events
+        self.reports = reports
+
+    def simulation(self, simulation_id: str) -> pd.DataFrame:
+        """Return the rows of one simulation.
+
+        Args:
+            simulation_id (str): Key of the simulation
+
+        Returns:
+            pd.DataFrame: Numeric rows of that simulation
+        """
+        return self.data.xs(simulation_id, level="Simulation")
+
+    def timings(self) -> pd.DataFrame:
+        """Return the per-file load report as a table.
+
+        Returns:
+            pd.DataFrame: One row per export with its path, load time, row count and error
+        """
+        return pd.DataFrame(
+            [
+                {
+                    "Simulation": report.simulation_id,
+                    "Path": report.path,
+                    "Seconds": report.seconds,
+                    "Rows": report.rows,
+                    "Error": report.error,
+                }
+                for report in self.reports
+            ],
+            columns=["Simulation", "Path", "Seconds", "Rows", "Error"],
+        )
+
+
+def expand_paths(paths) -> list:
+    """Expand a glob pattern or a list of paths and patterns into file paths.
+
+    Args:
+        paths (str | list): Glob pattern, path, or list of either
+
+    Returns:
+        list: Matching file paths in a stable order, without duplicates
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    expanded = []
+    for pattern in paths:
+        matches = sorted(glob.glob(pattern, recursive=True)) if glob.has_magic(pattern) else [pattern]
+        for path in matches:
+            if path not in expanded:
+                expanded.append(path)
+    return expanded
+
+
+def simulation_ids(paths: list) -> list:
+    """Key each export by its file name, falling back to the full path when names collide."""
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in paths]
+    return [stem if stems.count(stem) == 1 else os.path.normpath(path) for stem, path in zip(stems, paths)]
+
+
+def _load_one(path: str) -> tuple:
+    """Load one export in a worker process.
+
+    Returns:
+        tuple: (export or None, seconds, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        export = load_openrocket_csv(path)
+        return export, time.perf_counter() - start, None
+    except Exception as e:
+        return None, time.perf_counter() - start, f"{type(e).__name__}: {e}"
+
+
+def load_many(paths, workers: int = None) -> BatchResult:
+    """Load many OpenRocket exports in a process pool and stack them into one dataset.
+
+    Every export is aligned to a shared schema, the union of all columns in first-seen
+    order, so exports with missing channels hold NaN there. Exports that fail to load
+    are reported rather than aborting the batch.
+
+    Args:
+        paths (str | list): Glob pattern, path, or list of either
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        BatchResult: Stacked data and events with per-file timing and error reports
+    """
+    paths = expand_paths(paths)
+    ids = simulation_ids(paths)
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(paths) <= 1:
+        results = [_load_one(path) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            results = list(pool.map(_load_one, paths))
+
+    schema = []
+    frames = {}
+    events = []
+    reports = []
+    for simulation_id, path, (export, seconds, error) in zip(ids, paths, results):
+        if export is None:
+            reports.append(LoadReport(simulation_id, path, seconds, error=error))
+            continue
+        schema.extend(column for column in export.columns if column not in schema)
+        frames[simulation_id] = export.to_frame()
+        simulation_events = canonical_events(export.events)
+        simulation_events.insert(0, "Simulation", simulation_id)
+        events.append(simulation_events)
+        reports.append(LoadReport(simulation_id, path, seconds, rows=len(export.data)))
+
+    if frames:
+        data = pd.concat(
+            [frame.reindex(columns=schema) for frame in frames.values()],
+            keys=list(frames.keys()),
+            names=["Simulation", "Row"],
+        )
+        events = pd.concat(events, ignore_index=True)
+    else:
+        data = pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=["Simulation", "Row"]))
+        events = pd.DataFrame(columns=["Simulation", "Time (s)", "Event"])
+    return BatchResult(data, events, reports)
@@ -0,0 +1,237 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from batch_loader import expand_paths, simulation_ids
+from export_cache import file_key
+from rocket_web import PLOTS
+
+
+OPENROCKET = "openrocket"
+RASAERO = "rasaero"
+MANIFEST_FILE = "manifest.json"
+
+
+def detect_kind(filepath: str) -> str:
+    """Tell OpenRocket exports from RASAero exports by their first line.
+
+    Args:
+        filepath (str): Path to the export
+
+    Returns:
+        str: OPENROCKET or RASAERO
+    """
+    with open(filepath, encoding="utf-8-sig", errors="replace") as handle:
+        first_line = handle.readline()
+    if first_line.startswith("#"):
+        return OPENROCKET
+    if first_line.split(",")[0].strip().strip('"') == "Mach":
+        return RASAERO
+    raise ValueError(f"Not an OpenRocket or RASAero export: '{filepath}'")
+
+
+def spec_hash(spec: dict) -> str:
+    """Hash the parts of the plot spec that change the outputs."""
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _render_openrocket(filepath: str, directory: str, spec: dict) -> tuple:
+    """Render the report of one OpenRocket export.
+
+    Returns:
+        tuple: (output paths, per-plot timings)
+    """
+    from rocket_web import Rocket
+
+    rocket = Rocket(filepath)
+    rocket.apply_settings(spec["settings"])
+    output_path = os.path.join(directory, "Report.pdf" if spec["format"] == "pdf" else "Report")
+    # Every input has its own process already, so plots are drawn one after another
+    report = rocket.render_report(spec["plots"], output_path, spec["format"], workers=1)
+    timings = [{"plot": timing.plot, "seconds": timing.seconds} for timing in report.plot_timings]
+    return report.paths, timings
+
+
+def _render_rasaero(filepath: str, directory: str, spec: dict) -> tuple:
+    """Export the Mach and CD table of one RASAero export.
+
+    Returns:
+        tuple: (output paths, per-output timings)
+    """
+    from data_handler import DataHandler
+
+    start = time.perf_counter()
+    data_handler = DataHandler(ras_filepath=filepath)
+    data_handler.set_max_RAS_mach(spec["max_mach"])
+    data_handler.filter_mach_from_ras_csv()
+    os.makedirs(directory, exist_ok=True)
+    output_path = os.path.join(directory, "Mach_CD.txt")
+    data_handler.export_mach_cd_df_to_txt(output_path)
+    return [output_path], [{"plot": "Mach_CD", "seconds": time.perf_counter() - start}]
+
+
+def run_job(job: dict) -> dict:
+    """Render the outputs of one input in a worker process.
+
+    Args:
+        job (dict): Input path, kind, output directory and plot spec
+
+    Returns:
+        dict: Manifest entry of the input
+    """
+    start = time.perf_counter()
+    entry = {key: job[key] for key in ("input", "simulation", "kind", "key", "spec_hash")}
+    try:
+        render = _render_openrocket if job["kind"] == OPENROCKET else _render_rasaero
+        entry["outputs"], entry["plots"] = render(job["input"], job["directory"], job["spec"])
+        entry["status"] = "rendered"
+        entry["error"] = None
+    except Exception as e:
+        entry["outputs"], entry["plots"] = [], []
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = time.perf_counter() - start
+    return entry
+
+
+def load_manifest(path: str) -> dict:
+    """Return the previous manifest entries by input path, or none if there is no manifest."""
+    try:
+        with open(path, encoding="utf-8") as handle:
+            return {entry["input"]: entry for entry in json.load(handle)["inputs"]}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def is_current(previous: dict, key: str, spec_digest: str) -> bool:
+    """Check whether a previous run already rendered an input with the same contents and spec."""
+    return (
+        previous is not None
+        and previous["status"] in ("rendered", "skipped")
+        and previous["key"] == key
+        and previous["spec_hash"] == spec_digest
+        and all(os.path.exists(path) for path in previous["outputs"])
+    )
+
+
+def batch_report(paths, output_dir: str, spec: dict, workers: int = None, force: bool = False) -> dict:
+    """Render the reports of many exports in a process pool and write a timing manifest.
+
+    Inputs whose contents and plot spec match the previous manifest, and whose outputs
+    still exist, are skipped.
+
+    Args:
+        paths (str | list): Glob pattern, path, or list of either
+        output_dir (str): Directory of the reports, one subdirectory per input
+        spec (dict): 'plots', 'format', 'settings' and 'max_mach' of the reports
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        force (bool, optional): Render every input even if it is current. Defaults to False.
+
+    Returns:
+        dict: The manifest, also written to MANIFEST_FILE in output_dir
+    """
+    start = time.perf_counter()
+    paths = expand_paths(paths)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    previous = {} if force else load_manifest(manifest_path)
+    spec_digest = spec_hash(spec)
+
+    entries = {}
+    jobs = []
+    for simulation, path in zip(simulation_ids(paths), paths):
+        entry = {"input": path, "simulation": simulation, "spec_hash": spec_digest}
+        try:
+            entry["kind"] = detect_kind(path)
+            entry["key"] = file_key(path, entry["kind"])
+        except (OSError, ValueError) as e:
+            entry.update(kind=None, key=None, status="failed", error=f"{type(e).__name__}: {e}",
+                         outputs=[], plots=[], seconds=0.0)
+            entries[path] = entry
+            continue
+        if is_current(previous.get(path), entry["key"], spec_digest):
+            entries[path] = dict(previous[path], status="skipped", seconds=0.0)
+            continue
+        entries[path] = None
+        jobs.append(dict(entry, directory=os.path.join(output_dir, simulation.replace(os.sep, "_")), spec=spec))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        results = [run_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(run_job, jobs))
+    for entry in results:
+        entries[entry["input"]] = entry
+
+    manifest = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "spec": spec,
+        "workers": workers,
+        "seconds": time.perf_counter() - start,
+        "inputs": list(entries.values()),
+    }
+    write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def write_manifest(path: str, manifest: dict) -> None:
+    """Write a manifest atomically, so an interrupted run never leaves a partial one behind."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(manifest, handle, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+def _parse_setting(text: str) -> tuple:
+    """Parse a NAME=VALUE plot setting, reading the value as JSON where it is valid JSON."""
+    name, separator, value = text.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError(f"Expected NAME=VALUE, got '{text}'")
+    try:
+        return name, json.loads(value)
+    except ValueError:
+        return name, value
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Render headless reports for many OpenRocket and RASAero exports."
+    )
+    parser.add_argument("inputs", nargs="+", help="Exports or glob patterns, e.g. 'data/**/*.csv'")
+    parser.add_argument("-o", "--output", default=os.path.join("project", "output", "reports"),
+                        help="Directory of the reports and the manifest")
+    parser.add_argument("-p", "--plots", default=",".join(PLOTS),
+                        help="Comma-separated plots of OpenRocket reports")
+    parser.add_argument("-f", "--format", default="pdf", choices=["pdf", "png", "svg"],
+                        help="One multi-page PDF or one image per plot")
+    parser.add_argument("-s", "--set", dest="settings", action="append", type=_parse_setting, default=[],
+                        metavar="NAME=VALUE", help="Plot setting, e.g. MOTOR_NAME=M2100 or DISPLAY_APOGEE=true")
+    parser.add_argument("--max-mach", type=float, default=2.0, help="Highest Mach number of RASAero exports")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Render inputs even if their outputs are current")
+    args = parser.parse_args(argv)
+
+    spec = {
+        "plots": [plot.strip() for plot in args.plots.split(",") if plot.strip()],
+        "format": args.format,
+        "settings": dict(args.settings),
+        "max_mach": args.max_mach,
+    }
+    manifest = batch_report(args.inputs, args.output, spec, args.workers, args.force)
+
+    counts = {}
+    for entry in manifest["inputs"]:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        if entry["status"] == "failed":
+            print(f"Error rendering {entry['input']}: {entry['error']}", file=sys.stderr)
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"{len(manifest['inputs'])} inputs in {manifest['seconds']:.2f} s ({summary or 'none'})")
+    return 1 if counts.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
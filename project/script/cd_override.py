@@ -0,0 +1,184 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+import pandas as pd
+from batch_loader import expand_paths, simulation_ids
+from batch_report import MANIFEST_FILE, RASAERO, detect_kind, is_current, load_manifest, spec_hash, write_manifest
+from drag_table import DragTable
+from export_cache import file_key
+from rasaero_parser import MACH_COLUMN, load_rasaero_export
+
+
+COEFFICIENT = "CD"
+
+
+def override_filename(max_mach: float, alpha: float) -> str:
+    """Name the override file of one Mach cap and angle of attack, e.g. 'Mach_CD_M2_A0.txt'."""
+    return f"Mach_{COEFFICIENT}_M{max_mach:g}_A{alpha:g}.txt"
+
+
+def write_overrides(filepath: str, directory: str, max_machs: list, alphas: list) -> list:
+    """Write the Mach and CD override files of one RASAero export.
+
+    The export is read and pivoted once, then every angle of attack is interpolated
+    on its Mach grid and cut at every Mach cap. Angles of attack between the exported
+    ones are interpolated linearly.
+
+    Args:
+        filepath (str): Path to the RASAero CSV export
+        directory (str): Directory to write the override files to
+        max_machs (list): Highest Mach number of each override
+        alphas (list): Angle of attack of each override (deg)
+
+    Returns:
+        list: Path, Mach cap, angle of attack and number of rows of each file written
+    """
+    table = DragTable.from_frame(load_rasaero_export(filepath, [COEFFICIENT]).to_frame())
+    for alpha in alphas:
+        if not table.alpha[0] <= alpha <= table.alpha[-1]:
+            raise ValueError(
+                f"Invalid alpha '{alpha:g}'. Please choose from {table.alpha[0]:g} to {table.alpha[-1]:g} deg."
+            )
+
+    os.makedirs(directory, exist_ok=True)
+    files = []
+    for alpha in alphas:
+        values = table.coeff(COEFFICIENT, table.mach, alpha)
+        for max_mach in max_machs:
+            keep = table.mach <= max_mach
+            path = os.path.join(directory, override_filename(max_mach, alpha))
+            # Same layout as DataHandler.export_mach_cd_df_to_txt
+            pd.DataFrame({MACH_COLUMN: table.mach[keep], COEFFICIENT: values[keep]}).to_csv(path, sep="\t", index=False)
+            files.append({"path": path, "max_mach": max_mach, "alpha": alpha, "rows": int(keep.sum())})
+    return files
+
+
+def run_export(job: dict) -> dict:
+    """Write the override files of one export in a worker process.
+
+    Args:
+        job (dict): Input path, output directory, Mach caps and angles of attack
+
+    Returns:
+        dict: Manifest entry of the input
+    """
+    start = time.perf_counter()
+    entry = {key: job[key] for key in ("input", "simulation", "kind", "key", "spec_hash")}
+    try:
+        entry["files"] = write_overrides(job["input"], job["directory"], job["spec"]["max_mach"], job["spec"]["alpha"])
+        entry["outputs"] = [output["path"] for output in entry["files"]]
+        entry["status"] = "rendered"
+        entry["error"] = None
+    except Exception as e:
+        entry["files"], entry["outputs"] = [], []
+        entry["status"] = "failed"
+        entry["error"] = f"{type(e).__name__}: {e}"
+    entry["seconds"] = time.perf_counter() - start
+    return entry
+
+
+def export_cd_overrides(paths, output_dir: str, max_machs: list, alphas: list = (0.0,), workers: int = None,
+                        force: bool = False) -> dict:
+    """Write the OpenRocket CD override files of many RASAero exports in a process pool.
+
+    Every export gets one tab-delimited Mach/CD file per Mach cap and angle of attack,
+    and one manifest entry holding its source hash and outputs. Exports whose contents,
+    caps and angles match the previous manifest, and whose files still exist, are skipped.
+
+    Args:
+        paths (str | list): Glob pattern, path, or list of either
+        output_dir (str): Directory of the override files, one subdirectory per export
+        max_machs (list): Highest Mach number of each override
+        alphas (list, optional): Angle of attack of each override (deg). Defaults to 0 only.
+        workers (int, optional): Number of worker processes. Defaults to the number of CPUs.
+        force (bool, optional): Export every input even if it is current. Defaults to False.
+
+    Returns:
+        dict: The manifest, also written to MANIFEST_FILE in output_dir
+    """
+    start = time.perf_counter()
+    paths = expand_paths(paths)
+    manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+    previous = {} if force else load_manifest(manifest_path)
+    spec = {"max_mach": [float(cap) for cap in max_machs], "alpha": [float(alpha) for alpha in alphas]}
+    spec_digest = spec_hash(spec)
+
+    entries = {}
+    jobs = []
+    for simulation, path in zip(simulation_ids(paths), paths):
+        entry = {"input": path, "simulation": simulation, "spec_hash": spec_digest}
+        try:
+            entry["kind"] = detect_kind(path)
+            if entry["kind"] != RASAERO:
+                raise ValueError(f"Not a RASAero export: '{path}'")
+            entry["key"] = file_key(path, entry["kind"])
+        except (OSError, ValueError) as e:
+            entry.update(kind=entry.get("kind"), key=None, status="failed", error=f"{type(e).__name__}: {e}",
+                         files=[], outputs=[], seconds=0.0)
+            entries[path] = entry
+            continue
+        if is_current(previous.get(path), entry["key"], spec_digest):
+            entries[path] = dict(previous[path], status="skipped", seconds=0.0)
+            continue
+        entries[path] = None
+        jobs.append(dict(entry, directory=os.path.join(output_dir, simulation.replace(os.sep, "_")), spec=spec))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        results = [run_export(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(run_export, jobs))
+    for entry in results:
+        entries[entry["input"]] = entry
+
+    manifest = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "spec": spec,
+        "workers": workers,
+        "seconds": time.perf_counter() - start,
+        "inputs": list(entries.values()),
+    }
+    write_manifest(manifest_path, manifest)
+    return manifest
+
+
+def _parse_numbers(text: str) -> list:
+    """Parse a comma-separated list of numbers, e.g. '1.5,2,3'."""
+    try:
+        return [float(value) for value in text.split(",") if value.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected comma-separated numbers, got '{text}'")
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Write OpenRocket CD override files for many RASAero exports, Mach caps and angles of attack."
+    )
+    parser.add_argument("inputs", nargs="+", help="RASAero exports or glob patterns, e.g. 'sweep/**/*.CSV'")
+    parser.add_argument("-o", "--output", default=os.path.join("project", "output", "cd_overrides"),
+                        help="Directory of the override files and the manifest")
+    parser.add_argument("-m", "--max-mach", type=_parse_numbers, default=[2.0],
+                        help="Comma-separated Mach caps, e.g. 1.5,2,3")
+    parser.add_argument("-a", "--alpha", type=_parse_numbers, default=[0.0],
+                        help="Comma-separated angles of attack (deg), e.g. 0,2,4")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Number of worker processes")
+    parser.add_argument("--force", action="store_true", help="Export inputs even if their files are current")
+    args = parser.parse_args(argv)
+
+    manifest = export_cd_overrides(args.inputs, args.output, args.max_mach, args.alpha, args.workers, args.force)
+
+    counts = {}
+    for entry in manifest["inputs"]:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        if entry["status"] == "failed":
+            print(f"Error exporting {entry['input']}: {entry['error']}", file=sys.stderr)
+    summary = ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+    print(f"{len(manifest['inputs'])} inputs in {manifest['seconds']:.2f} s ({summary or 'none'})")
+    return 1 if counts.get("failed") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
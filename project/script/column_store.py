@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from export_cache import CACHE_DIR, load_openrocket_csv
+from openrocket_parser import ExportPreamble
+
+
+INDEX_FILE = "index.json"
+STORE_VERSION = 2
+# Stores of exports in folders that cannot be written to live here, one per export path
+STORE_CACHE_DIR = os.path.join(CACHE_DIR, "columns")
+
+
+class ColumnStore:
+    """Directory of memory-mapped .npy files, one per simulation channel, described by an index file.
+
+    Columns are only paged in from disk when they are read, so a plot touching four
+    channels of a 54 variable export never loads the other fifty.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Open an existing column store.
+
+        Args:
+            directory (str): Directory holding the index file and the .npy channels
+        """
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE), encoding="utf-8") as handle:
+            self.index = json.load(handle)
+        self.columns = self.index["columns"]
+        self.source_key = self.index["source"].get("key")
+        self._files = dict(zip(self.columns, self.index["files"]))
+        self._mapped = {}
+
+        self.preamble = ExportPreamble()
+        self.preamble.simulation_name = self.index["preamble"]["simulation_name"]
+        self.preamble.declared_rows = self.index["preamble"]["declared_rows"]
+        self.preamble.declared_columns = self.index["preamble"]["declared_columns"]
+        self.preamble.warnings = self.index["preamble"]["warnings"]
+        self.preamble.columns = self.columns
+        self.events = pd.DataFrame(
+            {
+                "Time (s)": np.array(self.index["events"]["Time (s)"], dtype=np.float64),
+                "Event": pd.Series(self.index["events"]["Event"], dtype=object),
+            }
+        )
+
+    @property
+    def warnings(self) -> list:
+        """list: Simulation warnings listed in the export preamble."""
+        return self.preamble.warnings
+
+    def column(self, name: str) -> np.ndarray:
+        """Return a read-only memory map of one channel.
+
+        Args:
+            name (str): Column name
+
+        Returns:
+            np.ndarray: Memory-mapped float64 array
+        """
+        if name not in self._mapped:
+            path = os.path.join(self.directory, self._files[name])
+            self._mapped[name] = np.load(path, mmap_mode="r")
+        return self._mapped[name]
+
+    def to_frame(self, columns: list = None) -> pd.DataFrame:
+        """Return a DataFrame backed by the memory-mapped channels.
+
+        Args:
+            columns (list, optional): Columns to include. Defaults to every column in the store.
+
+        Returns:
+            pd.DataFrame: DataFrame whose columns are paged in only when read
+        """
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({name: self.column(name) for name in columns}, copy=False)
+
+    def is_current(self, filepath: str) -> bool:
+        """Check whether the store was built from the current version of a source file.
+
+        Args:
+            filepath (str): Path to the source export
+
+        Returns:
+            bool: True if the size and modification time of the source still match
+        """
+        stat = os.stat(filepath)
+        source = self.index["source"]
+        return (
+            self.index["version"] == STORE_VERSION
+            and source["size"] == stat.st_size
+            and source["mtime_ns"] == stat.st_mtime_ns
+        )
+
+
+def write_column_store(filepath: str, directory: str) -> ColumnStore:
+    """Parse an OpenRocket export and write it out as a column store.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        directory (str): Directory to write the store to
+
+    Returns:
+        ColumnStore: The newly written store
+    """
+    stat = os.stat(filepath)
+    export = load_openrocket_csv(filepath)
+    os.makedirs(directory, exist_ok=True)
+
+    files = []
+    for i, name in enumerate(export.columns):
+        filename = f"column_{i:03d}.npy"
+        np.save(os.path.join(directory, filename), export.data[:, i])
+        files.append(filename)
+
+    preamble = export.preamble
+    index = {
+        "version": STORE_VERSION,
+        "source": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "key": export.source_key},
+        "rows": len(export.data),
+        "columns": export.columns,
+        "files": files,
+        "preamble": {
+            "simulation_name": preamble.simulation_name,
+            "declared_rows": preamble.declared_rows,
+            "declared_columns": preamble.declared_columns,
+            "warnings": preamble.warnings,
+        },
+        "events": {
+            "Time (s)": export.events["Time (s)"].tolist(),
+            "Event": export.events["Event"].tolist(),
+        },
+    }
+    # The index is written last and atomically, so a store is only ever opened once complete
+    tmp_path = os.path.join(directory, INDEX_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as handle:
+        json.dump(index, handle, ensure_ascii=False)
+    os.replace(tmp_path, os.path.join(directory, INDEX_FILE))
+    return ColumnStore(directory)
+
+
+def store_directories(filepath: str) -> list:
+    """Return the directories a column store of an export may live in, in order of preference.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+
+    Returns:
+        list: '<filepath>.columns' next to the export, then one named after its absolute path in STORE_CACHE_DIR
+    """
+    name = hashlib.sha256(os.path.abspath(filepath).encode()).hexdigest()
+    return [filepath + ".columns", os.path.join(STORE_CACHE_DIR, name)]
+
+
+def open_column_store(filepath: str, directory: str = None) -> ColumnStore:
+    """Open the column store of an OpenRocket export, building it first if missing or stale.
+
+    Without a directory, the store is kept next to the export, or in STORE_CACHE_DIR
+    when the folder of the export cannot be written to.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        directory (str, optional): Store directory. Defaults to the first writable of store_directories().
+
+    Returns:
+        ColumnStore: Store holding every channel of the export
+    """
+    directories = [directory] if directory else store_directories(filepath)
+    for candidate in directories:
+        try:
+            store = ColumnStore(candidate)
+            if store.is_current(filepath):
+                return store
+        except (OSError, ValueError, KeyError):
+            pass
+    for i, candidate in enumerate(directories):
+        try:
+            return write_column_store(filepath, candidate)
+        except OSError as e:
+            if i == len(directories) - 1:
+                raise
+            print(f"Error writing the column store to {candidate}, using {directories[i + 1]} instead: {e}")
@@ -1,5 +1,9 @@
 import pandas as pd
-import re
+from drag_table import DragTable
+from export_cache import load_openrocket_csv
+from flight_events import EventIndex, canonical_events
+from flight_summary import FlightSummary, summarise_flight
+from rasaero_parser import load_rasaero_export
 
 
 class DataHandler:
@@ -14,12 +18,14 @@ class DataHandler:
         """
         self.or_filepath = or_filepath
         self.ras_filepath = ras_filepath
-        self.df = None
+        self.export = None
         self.comments_df = None
         self.merged_df = None
+        self.event_index = None
         self.filtered_or_df = None
         self.ras_df = None
         self.filtered_ras_df = None
+        self._drag_table = None
         self.max_RAS_mach = 2.0
         self._prepare_dataframes()
         
@@ -35,19 +41,19 @@ class DataHandler:
 
     def _read_OR_csv(self) -> None:
         """
-        _read_OR_csv  Reads the Open Rocket CSV file and stores it in a DataFrame.
+        _read_OR_csv  Reads the Open Rocket CSV file in a single pass, splitting event comments from numeric rows. Unchanged files are served from the export cache.
         """
         try:
-            self.df = pd.read_csv(self.or_filepath, delimiter=",", skiprows=6)
+            self.export = load_openrocket_csv(self.or_filepath)
         except Exception as e:
             print(f"Error reading the OR CSV file: {e}")
 
     def _read_RASAero_csv(self) -> None:
         """
-        _read_RASAero_csv  Reads the RAS Aero CSV file and stores it in a Dataframe.
+        _read_RASAero_csv  Reads the RAS Aero CSV file with a typed parser that checks its Mach/Alpha grid, and stores it in a Dataframe. Unchanged files are served from their binary sidecar in the export cache.
         """
         try:
-            self.ras_df = pd.read_csv(self.ras_filepath)
+            self.ras_df = load_rasaero_export(self.ras_filepath).to_frame()
         except Exception as e:
             print(f"Error reading the RAS CSV file: {e}")
             
@@ -73,6 +79,7 @@ class DataHandler:
             self._filter_comments()
             self.filtered_or_df = self._filter_data()
             self.merged_df = self._merge_dataframes()
+            self.event_index = EventIndex.from_frame(self.merged_df, self.comments_df)
         elif self.ras_filepath != "":
             self._read_RASAero_csv()
             self.filter_mach_from_ras_csv()
@@ -86,101 +93,40 @@ class DataHandler:
         filtered_RAS_df = filtered_RAS_df.drop_duplicates(subset=['Mach'])
         self.filtered_ras_df = filtered_RAS_df
 
+    def drag_table(self) -> DragTable:
+        """
+        drag_table  Returns the RAS Aero export pivoted into a Mach × Alpha grid of every coefficient, for vectorised bilinear lookups. The grid is built once per DataHandler.
+
+        :return:  Coefficients of the RAS Aero export on a dense grid
+        :rtype: DragTable
+        """
+        if self._drag_table is None:
+            self._drag_table = DragTable.from_frame(self.ras_df)
+        return self._drag_table
+
     def _filter_comments(self) -> None:
         """
-        _filter_comments  Filters comments from the main DataFrame and stores them separately.
+        _filter_comments  Stores the events of the export under their canonical names, merging paired events such as LAUNCH/IGNITION.
         """
-        comments_mask = self.df["# Time (s)"].astype(str).str.contains("#")
-        comments_df = self.df[comments_mask].copy()
-        comments_df["Time (s)"] = comments_df["# Time (s)"].apply(
-            self._extract_time)
-        comments_df["Event"] = comments_df["# Time (s)"].apply(
-            self._extract_event)
-        self.comments_df = self._process_comment_events(comments_df)
+        self.comments_df = canonical_events(self.export.events)
 
     def _filter_data(self) -> pd.DataFrame:
         """
-        _filter_data  Filters out comment rows from the main DataFrame.
+        _filter_data  Returns the numeric rows of the export, which the parser keeps apart from comment rows.
 
         :return:  Filtered DataFrame
         :rtype: pd.DataFrame
         """
-        filtered_or_df = self.df[~self.df["# Time (s)"].astype(
-            str).str.contains("#")].copy()
-        filtered_or_df.rename(columns={"# Time (s)": "Time (s)"}, inplace=True)
-        return filtered_or_df
+        return self.export.to_frame()
 
     def _merge_dataframes(self) -> pd.DataFrame:
         """
-        _merge_dataframes  Merges the filtered data with the comments data. As well as cleans U+200B characters.
+        _merge_dataframes  Returns the merged data. Column names are already cleaned of U+200B characters by the parser, and events are not stored as a column, the event index keeps their row positions instead.
 
         :return:  Merged DataFrame
         :rtype: pd.DataFrame
         """
-        # Convert 'Time (s)' in both dataframes to float
-        self.filtered_or_df["Time (s)"] = pd.to_numeric(
-            self.filtered_or_df["Time (s)"], errors='coerce')
-        if self.comments_df is not None:
-            self.comments_df["Time (s)"] = pd.to_numeric(
-                self.comments_df["Time (s)"], errors='coerce')
-
-        # Perform the merge
-        merged = self.filtered_or_df.merge(
-            self.comments_df, on="Time (s)", how="left")
-
-        # Clean U+200B characters from data
-        for column in merged.columns:
-            if merged[column].dtype == object:
-                merged[column] = merged[column].str.replace('\u200b', '')
-
-        # Clean U+200B characters from column names
-        merged.columns = [col.replace('\u200b', '') for col in merged.columns]
-
-        return merged
-
-    def _extract_time(self, text: str) -> float:
-        """
-        _extract_time  Extracts time from a comment string. The string must be in the format: "occurred at t=0.000 seconds"
-
-        :param text:  Comment string
-        :type text: str
-        :return:  Time in seconds
-        :rtype: float
-        """
-        match = re.search(r"t=([\d\.]+)", text)
-        return float(match.group(1)) if match else None
-
-    def _extract_event(self, text: str) -> str:
-        """
-        _extract_event  Extracts event name from a comment string. The string must be in the format: "occurred at t=0.000 seconds"
-
-        :param text:  Comment string
-        :type text: str
-        :return:  Event name
-        :rtype: str
-        """
-        return text.replace(r"occurred at t=[\d\.]+ seconds", "").replace("#", "").strip()
-
-    def _process_comment_events(self, comments_df: pd.DataFrame) -> pd.DataFrame:
-        """
-        _process_comment_events  Processes events in the comments dataframe. This includes removing non-caps words, replacing events, and removing events.
-
-        :param comments_df:  Comments DataFrame
-        :type comments_df: pd.DataFrame
-        :return:  Processed comments DataFrame
-        :rtype: pd.DataFrame
-        """
-
-        comments_df["Event"] = comments_df["Event"].apply(self.remove_non_caps)
-        events_to_replace = {
-            "LAUNCH": "LAUNCH/IGNITION",
-            "BURNOUT": "BURNOUT/EJECTION_CHARGE",
-            "GROUND_HIT": "GROUND_HIT/SIMULATION_END"
-        }
-        events_to_remove = ["IGNITION", "EJECTION_CHARGE", "SIMULATION_END"]
-        comments_df["Event"] = comments_df["Event"].replace(events_to_replace)
-        comments_df = comments_df[~comments_df["Event"].isin(events_to_remove)]
-        return comments_df[["Time (s)", "Event"]]
+        return self.filtered_or_df
 
     def find_event_time(self, event_name: str) -> float:
         """
@@ -191,9 +137,7 @@ class DataHandler:
         :return:  Time in seconds
         :rtype: float
         """
-        event_time = self.merged_df.loc[self.merged_df["Event"]
-                                        == event_name, "Time (s)"]
-        return float(event_time.iloc[0]) if not event_time.empty else None
+        return self.event_index.time(event_name)
 
     def find_event_mach(self, event_name: str) -> float:
         """
@@ -204,18 +148,22 @@ class DataHandler:
         :return:  Mach number
         :rtype: float
         """
+        return self.event_index.mach(event_name)
 
-        event_mach = self.merged_df.loc[self.merged_df["Event"]
-                                        == event_name, "Mach number ()"]
-        return float(event_mach.iloc[0]) if not event_mach.empty else None
+    def events(self) -> pd.DataFrame:
+        """
+        events  Returns every event with the flight state when it occurred.
+
+        :return:  One row per event with its row position, time, Mach, altitude and velocity
+        :rtype: pd.DataFrame
+        """
+        return self.event_index.events()
 
-    def remove_non_caps(self, text: str) -> str:
+    def summary(self) -> FlightSummary:
         """
-        remove_non_caps  Removes all words that are not in all caps from the given text.
+        summary  Summarises the flight: apogee, peak velocity, acceleration, Mach and dynamic pressure, stability margins and the flight state at key events. Summaries are memoised per dataset.
 
-        :param text:  Text to remove non-caps words from
-        :type text: str
-        :return:  Text with non-caps words removed
-        :rtype: str
+        :return:  Key numbers of the flight
+        :rtype: FlightSummary
         """
-        return " ".join(word for word in text.split() if word.isupper())
+        return summarise_flight(self.merged_df, self.event_index, key=self.export.source_key)
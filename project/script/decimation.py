@@ -0,0 +1,166 @@
+import numpy as np
+
+
+# Series with more samples than this are decimated before plotting
+DECIMATION_THRESHOLD = 10000
+DECIMATION_MODES = ("minmax", "lttb")
+
+
+def bucket_starts(x: np.ndarray, buckets: int) -> np.ndarray:
+    """Return the first row of each non-empty bucket of equal width along x.
+
+    Dense phases such as the burn get no more buckets than the same span of coast,
+    which matches the equal pixel columns the series is drawn into.
+
+    Args:
+        x (np.ndarray): Sample positions, sorted in ascending order
+        buckets (int): Number of buckets
+
+    Returns:
+        np.ndarray: Sorted first row of each bucket holding at least one sample
+    """
+    n = len(x)
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+    if np.isfinite(x[0]) and np.isfinite(x[-1]) and x[-1] > x[0]:
+        edges = np.searchsorted(x, np.linspace(x[0], x[-1], buckets + 1)[:-1], side="left")
+    else:
+        # No usable span of x, fall back to buckets of equal count
+        edges = np.linspace(0, n, buckets + 1)[:-1].astype(np.int64)
+    starts = np.unique(edges)
+    return starts[starts < n]
+
+
+def _first_per_bucket(rows: np.ndarray, bucket_of: np.ndarray) -> np.ndarray:
+    """Return the first of the rows in each bucket, given the bucket of every row."""
+    _, first = np.unique(bucket_of[rows], return_index=True)
+    return rows[first]
+
+
+def _bucket_extremes(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """Return the row of the first, last, smallest and largest sample of each equal-width bucket.
+
+    The first NaN of a bucket is kept as well, so gaps in a series still break the plotted line.
+    """
+    n = len(y)
+    starts = bucket_starts(x, buckets)
+    if len(starts) == 0:
+        return np.empty(0, dtype=np.int64)
+    ends = np.append(starts[1:], n)
+    bucket_of = np.repeat(np.arange(len(starts)), ends - starts)
+    nan = np.isnan(y)
+
+    low = np.where(nan, np.inf, y)
+    high = np.where(nan, -np.inf, y)
+    smallest = np.flatnonzero(low == np.minimum.reduceat(low, starts)[bucket_of])
+    largest = np.flatnonzero(high == np.maximum.reduceat(high, starts)[bucket_of])
+    return np.concatenate([
+        starts,
+        ends - 1,
+        _first_per_bucket(smallest, bucket_of),
+        _first_per_bucket(largest, bucket_of),
+        _first_per_bucket(np.flatnonzero(nan), bucket_of),
+    ])
+
+
+def minmax_rows(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """Select the rows to keep with min/max-per-bucket decimation.
+
+    x is split into buckets of equal width, and every bucket contributes its first,
+    last, smallest and largest sample, so the rendered envelope of the line is the
+    same as with every sample drawn.
+
+    Args:
+        x (np.ndarray): Sample positions, sorted in ascending order
+        y (np.ndarray): Series values
+        buckets (int): Number of buckets, usually the pixel width of the plot
+
+    Returns:
+        np.ndarray: Sorted row positions to keep
+    """
+    return np.unique(_bucket_extremes(np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), buckets))
+
+
+def lttb_rows(x: np.ndarray, y: np.ndarray, buckets: int) -> np.ndarray:
+    """Select the rows to keep with Largest-Triangle-Three-Buckets decimation.
+
+    One sample is kept per bucket, the one forming the largest triangle with the sample
+    kept from the previous bucket and the mean of the next bucket. This follows the visual
+    shape of the series more smoothly than min/max at the same number of points.
+
+    Args:
+        x (np.ndarray): Sample positions, sorted in ascending order
+        y (np.ndarray): Series values
+        buckets (int): Number of samples to keep, including the first and last
+
+    Returns:
+        np.ndarray: Sorted row positions to keep
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if buckets >= n or buckets < 3:
+        return np.arange(n)
+
+    # The first and last samples are kept, the rest are split into buckets - 2 ranges
+    edges = np.linspace(1, n - 1, buckets - 1).astype(np.int64)
+    rows = np.empty(buckets, dtype=np.int64)
+    rows[0] = 0
+    rows[-1] = n - 1
+    for i in range(buckets - 2):
+        start, stop = edges[i], edges[i + 1]
+        next_stop = edges[i + 2] if i + 2 < len(edges) else n
+        previous_x, previous_y = x[rows[i]], y[rows[i]]
+        next_valid = ~np.isnan(y[stop:next_stop])
+        if next_valid.any():
+            next_x = x[stop:next_stop][next_valid].mean()
+            next_y = y[stop:next_stop][next_valid].mean()
+        else:
+            # The next bucket is a gap, so the triangle collapses to the line from the previous sample
+            next_x, next_y = x[stop], previous_y
+        area = np.abs(
+            (previous_x - next_x) * (y[start:stop] - previous_y)
+            - (previous_x - x[start:stop]) * (next_y - previous_y)
+        )
+        rows[i + 1] = start + np.argmax(np.where(np.isnan(area), -np.inf, area))
+    return rows
+
+
+def decimate(x: np.ndarray, y: np.ndarray, buckets: int, mode: str = "minmax",
+             threshold: int = DECIMATION_THRESHOLD) -> tuple:
+    """Reduce a series to about the number of points a plot can show, keeping its peaks.
+
+    The global maximum and minimum of y, e.g. apogee or the peak acceleration, are
+    always kept exactly whichever mode is used. Series at or below the threshold are
+    returned as they are.
+
+    Args:
+        x (np.ndarray): Sample positions, sorted in ascending order
+        y (np.ndarray): Series values
+        buckets (int): Number of buckets, usually the pixel width of the plot
+        mode (str, optional): 'minmax' or 'lttb'. Defaults to 'minmax'.
+        threshold (int, optional): Smallest series length that is decimated. Defaults to DECIMATION_THRESHOLD.
+
+    Returns:
+        tuple: (x, y) of the samples to plot
+    """
+    n = len(y)
+    buckets = int(buckets)
+    if n <= threshold or buckets < 1:
+        return x, y
+    if mode == "minmax":
+        if 4 * buckets >= n:
+            return x, y
+        rows = minmax_rows(x, y, buckets)
+    elif mode == "lttb":
+        if buckets >= n:
+            return x, y
+        rows = lttb_rows(x, y, buckets)
+    else:
+        raise ValueError(f"Invalid decimation mode '{mode}'. Please choose 'minmax' or 'lttb'.")
+
+    values = np.asarray(y, dtype=np.float64)
+    if not np.isnan(values).all():
+        rows = np.concatenate([rows, [np.nanargmax(values), np.nanargmin(values)]])
+    rows = np.unique(rows)
+    return x[rows], y[rows]
@@ -0,0 +1,145 @@
+import numpy as np
+import pandas as pd
+from rasaero_parser import ALPHA_COLUMN, MACH_COLUMN, load_rasaero_export
+
+
+class DragTable:
+    """RASAero aerodynamic coefficients on a dense Mach × Alpha grid with vectorised bilinear lookup.
+
+    Lookups outside the grid are clamped to its edges.
+    """
+
+    def __init__(self, mach: np.ndarray, alpha: np.ndarray, grid: np.ndarray, coefficients: list) -> None:
+        """Initialise the DragTable.
+
+        Args:
+            mach (np.ndarray): Mach numbers of the grid rows, in ascending order
+            alpha (np.ndarray): Angles of attack of the grid columns (deg), in ascending order
+            grid (np.ndarray): Coefficient values, shaped (Mach, Alpha, coefficient)
+            coefficients (list): Coefficient names, e.g. 'CD', 'CN', 'CP'
+        """
+        self.mach = np.asarray(mach, dtype=np.float64)
+        self.alpha = np.asarray(alpha, dtype=np.float64)
+        self.grid = np.asarray(grid, dtype=np.float64)
+        self.coefficients = list(coefficients)
+        self._index = {name: i for i, name in enumerate(self.coefficients)}
+
+    @classmethod
+    def from_frame(cls, ras_df: pd.DataFrame) -> "DragTable":
+        """Pivot a RASAero export into a dense grid.
+
+        Cells missing from the export, such as the last Mach number of one angle of
+        attack, are filled along the Mach axis from their neighbours.
+
+        Args:
+            ras_df (pd.DataFrame): RASAero export with 'Mach' and 'Alpha' columns
+
+        Returns:
+            DragTable: Every other numeric column on the Mach × Alpha grid
+        """
+        coefficients = [
+            name for name in ras_df.columns
+            if name not in (MACH_COLUMN, ALPHA_COLUMN) and pd.api.types.is_numeric_dtype(ras_df[name])
+        ]
+        mach, mach_rows = np.unique(ras_df[MACH_COLUMN].to_numpy(dtype=np.float64), return_inverse=True)
+        alpha, alpha_rows = np.unique(ras_df[ALPHA_COLUMN].to_numpy(dtype=np.float64), return_inverse=True)
+        grid = np.full((len(mach), len(alpha), len(coefficients)), np.nan)
+        # Later rows win for repeated (Mach, Alpha) pairs
+        grid[mach_rows, alpha_rows] = ras_df[coefficients].to_numpy(dtype=np.float64)
+
+        missing = np.isnan(grid)
+        for j in range(len(alpha)):
+            for k in range(len(coefficients)):
+                column = missing[:, j, k]
+                if column.any() and not column.all():
+                    grid[column, j, k] = np.interp(mach[column], mach[~column], grid[~column, j, k])
+        return cls(mach, alpha, grid, coefficients)
+
+    @staticmethod
+    def _cell(axis: np.ndarray, values: np.ndarray) -> tuple:
+        """Return the lower grid index and interpolation weight of each value along one axis."""
+        if len(axis) == 1:
+            return np.zeros(values.shape, dtype=np.int64), np.zeros(values.shape)
+        lower = np.clip(np.searchsorted(axis, values, side="right") - 1, 0, len(axis) - 2)
+        weight = (values - axis[lower]) / (axis[lower + 1] - axis[lower])
+        return lower, np.clip(weight, 0.0, 1.0)
+
+    def coeffs(self, mach, alpha=0.0, coefficients: list = None) -> np.ndarray:
+        """Interpolate coefficients bilinearly at any number of points.
+
+        Args:
+            mach (float | np.ndarray): Mach numbers
+            alpha (float | np.ndarray, optional): Angles of attack (deg), broadcast against mach. Defaults to 0.
+            coefficients (list, optional): Names of the coefficients to return. Defaults to all of them.
+
+        Returns:
+            np.ndarray: Values shaped (*points, coefficient), in the order of coefficients
+        """
+        mach, alpha = np.broadcast_arrays(np.asarray(mach, dtype=np.float64), np.asarray(alpha, dtype=np.float64))
+        grid = self.grid
+        if coefficients is not None:
+            grid = grid[:, :, [self._index[name] for name in coefficients]]
+        # Rows of the flattened grid, so each corner is a single take()
+        rows = grid.reshape(-1, grid.shape[2])
+        width = len(self.alpha)
+
+        i, u = self._cell(self.mach, mach)
+        j, v = self._cell(self.alpha, alpha)
+        corner = i * width + j
+        step_mach = np.where(i + 1 < len(self.mach), width, 0)
+        step_alpha = np.where(j + 1 < width, 1, 0)
+        u = u[..., np.newaxis]
+        v = v[..., np.newaxis]
+        c00 = rows.take(corner, axis=0)
+        c10 = rows.take(corner + step_mach, axis=0)
+        c01 = rows.take(corner + step_alpha, axis=0)
+        c11 = rows.take(corner + step_mach + step_alpha, axis=0)
+        lower = c00 + (c10 - c00) * u
+        upper = c01 + (c11 - c01) * u
+        return lower + (upper - lower) * v
+
+    def coeff(self, name: str, mach, alpha=0.0) -> np.ndarray:
+        """Interpolate one coefficient bilinearly at any number of points.
+
+        Args:
+            name (str): Coefficient name, e.g. 'CD'
+            mach (float | np.ndarray): Mach numbers
+            alpha (float | np.ndarray, optional): Angles of attack (deg). Defaults to 0.
+
+        Returns:
+            np.ndarray: Values shaped like the broadcast of mach and alpha
+        """
+        return self.coeffs(mach, alpha, [name])[..., 0]
+
+    def cd(self, mach, alpha=0.0) -> np.ndarray:
+        """Interpolate the drag coefficient, see coeff()."""
+        return self.coeff("CD", mach, alpha)
+
+    def to_frame(self, alpha: float = 0.0, max_mach: float = None) -> pd.DataFrame:
+        """Return the grid at one angle of attack as a table.
+
+        Args:
+            alpha (float, optional): Angle of attack (deg), interpolated if not on the grid. Defaults to 0.
+            max_mach (float, optional): Highest Mach number to include. Defaults to all of them.
+
+        Returns:
+            pd.DataFrame: 'Mach', 'Alpha' and every coefficient, one row per grid Mach number
+        """
+        mach = self.mach if max_mach is None else self.mach[self.mach <= max_mach]
+        values = self.coeffs(mach, alpha)
+        frame = pd.DataFrame(values, columns=self.coefficients)
+        frame.insert(0, ALPHA_COLUMN, alpha)
+        frame.insert(0, MACH_COLUMN, mach)
+        return frame
+
+
+def load_drag_table(filepath: str) -> DragTable:
+    """Read a RASAero aero-plot export into a DragTable.
+
+    Args:
+        filepath (str): Path to the RASAero CSV export
+
+    Returns:
+        DragTable: The export on a dense Mach × Alpha grid
+    """
+    return DragTable.from_frame(load_rasaero_export(filepath).to_frame())
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from openrocket_parser import ExportPreamble, OpenRocketExport, read_openrocket_csv
+
+
+# Bump whenever the parsers change what they produce, so stale entries are never served
+CACHE_VERSION = 5
+
+CACHE_DIR = os.environ.get(
+    "AEROSPACE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "aerospace")
+)
+# Total size of the cache before the least recently used entries are evicted, 0 disables it
+MAX_CACHE_BYTES = int(float(os.environ.get("AEROSPACE_CACHE_MAX_MB", 512)) * 1024 * 1024)
+
+
+def file_key(filepath: str, kind: str) -> str:
+    """Build the content address of a source file.
+
+    Args:
+        filepath (str): Path to the source file
+        kind (str): Name of the parser the entry belongs to
+
+    Returns:
+        str: Hex digest of the file contents, size, modification time and cache version
+    """
+    stat = os.stat(filepath)
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"{kind}:{stat.st_size}:{stat.st_mtime_ns}:{CACHE_VERSION}".encode())
+    return digest.hexdigest()
+
+
+class ExportCache:
+    """On-disk cache of parsed simulation exports stored as uncompressed npz files."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        """Initialise the ExportCache.
+
+        Args:
+            cache_dir (str, optional): Directory holding the cache entries. Defaults to CACHE_DIR.
+            max_bytes (int, optional): Size cap of the cache directory. Defaults to MAX_CACHE_BYTES.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    @property
+    def enabled(self) -> bool:
+        """bool: Whether entries are read from and written to disk."""
+        return self.max_bytes > 0
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".npz")
+
+    def load(self, key: str) -> dict:
+        """Load the arrays stored under a key.
+
+        Args:
+            key (str): Content address from file_key
+
+        Returns:
+            dict: Arrays of the entry, or None on a cache miss
+        """
+        if not self.enabled:
+            return None
+        path = self._entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+            # Touch the entry so eviction sees it as recently used
+            os.utime(path)
+            return arrays
+        except (OSError, ValueError):
+            return None
+
+    def store(self, key: str, arrays: dict) -> None:
+        """Store arrays under a key and evict old entries beyond the size cap.
+
+        Args:
+            key (str): Content address from file_key
+            arrays (dict): Arrays to store
+        """
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            handle, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(handle, "wb") as tmp:
+                    np.savez(tmp, **arrays)
+                os.replace(tmp_path, self._entry_path(key))
+            except OSError:
+                os.remove(tmp_path)
+                raise
+            self.evict()
+        except OSError as e:
+            print(f"Error writing to the export cache: {e}")
+
+    def evict(self) -> None:
+        """Remove the least recently used entries until the cache fits its size cap."""
+        evict_lru(self.cache_dir, self.max_bytes, (".npz",))
+
+
+def evict_lru(directory: str, max_bytes: int, suffixes: tuple, keep: str = None) -> None:
+    """Remove the least recently used files of a cache directory until it fits a size cap.
+
+    Args:
+        directory (str): Cache directory
+        max_bytes (int): Size cap of the entries
+        suffixes (tuple): File suffixes of the entries, other files are left alone
+        keep (str, optional): Name of an entry that must not be removed. Defaults to None.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if name.endswith(suffixes):
+            try:
+                stat = os.stat(os.path.join(directory, name))
+            except OSError:
+                # Removed by a concurrent eviction
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        if name == keep:
+            continue
+        try:
+            os.remove(os.path.join(directory, name))
+        except OSError:
+            pass
+        total -= size
+
+
+default_cache = ExportCache()
+
+
+def _export_to_arrays(export: OpenRocketExport) -> dict:
+    preamble = export.preamble
+    meta = {
+        "simulation_name": preamble.simulation_name,
+        "declared_rows": preamble.declared_rows,
+        "declared_columns": preamble.declared_columns,
+        "warnings": preamble.warnings,
+    }
+    return {
+        "data": export.data,
+        "columns": np.array(export.columns, dtype=str),
+        "event_times": export.events["Time (s)"].to_numpy(dtype=np.float64),
+        "event_names": np.array(export.events["Event"].tolist(), dtype=str),
+        "meta": np.array(json.dumps(meta)),
+    }
+
+
+def _export_from_arrays(arrays: dict) -> OpenRocketExport:
+    meta = json.loads(str(arrays["meta"]))
+    preamble = ExportPreamble()
+    preamble.simulation_name = meta["simulation_name"]
+    preamble.declared_rows = meta["declared_rows"]
+    preamble.declared_columns = meta["declared_columns"]
+    preamble.warnings = meta["warnings"]
+    preamble.columns = arrays["columns"].tolist()
+    events = pd.DataFrame(
+        {
+            "Time (s)": arrays["event_times"],
+            "Event": pd.Series(arrays["event_names"].tolist(), dtype=object),
+        }
+    )
+    return OpenRocketExport(preamble, arrays["data"], events)
+
+
+def load_openrocket_csv(filepath: str, cache: ExportCache = None) -> OpenRocketExport:
+    """Read an OpenRocket CSV export, served from the export cache when unchanged.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        cache (ExportCache, optional): Cache to use. Defaults to the shared default_cache.
+
+    Returns:
+        OpenRocketExport: The parsed preamble, data and events
+    """
+    cache = cache or default_cache
+    if not cache.enabled:
+        return read_openrocket_csv(filepath)
+    key = file_key(filepath, "openrocket")
+    arrays = cache.load(key)
+    if arrays is not None:
+        export = _export_from_arrays(arrays)
+    else:
+        export = read_openrocket_csv(filepath)
+        cache.store(key, _export_to_arrays(export))
+    export.source_key = key
+    return export
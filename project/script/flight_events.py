@@ -0,0 +1,218 @@
+import numpy as np
+import pandas as pd
+
+
+TIME_COLUMN = "Time (s)"
+MACH_COLUMN = "Mach number ()"
+ALTITUDE_COLUMN = "Altitude (ft)"
+VELOCITY_COLUMN = "Total velocity (m/s)"
+
+# OpenRocket writes these events in pairs at the same time, each pair is reported as one event
+EVENT_ALIASES = {
+    "LAUNCH": "LAUNCH/IGNITION",
+    "BURNOUT": "BURNOUT/EJECTION_CHARGE",
+    "GROUND_HIT": "GROUND_HIT/SIMULATION_END",
+}
+MERGED_EVENTS = ["IGNITION", "EJECTION_CHARGE", "SIMULATION_END"]
+# Default largest distance between an event and its sample, in median sample intervals
+EVENT_TOLERANCE_INTERVALS = 2
+
+
+def canonical_events(events: pd.DataFrame) -> pd.DataFrame:
+    """Rename paired events to their combined names and drop the second event of each pair.
+
+    Args:
+        events (pd.DataFrame): Event table with 'Time (s)' and 'Event' columns
+
+    Returns:
+        pd.DataFrame: Event table using the canonical event names
+    """
+    names = events["Event"].replace(EVENT_ALIASES)
+    keep = ~names.isin(MERGED_EVENTS)
+    return pd.DataFrame({TIME_COLUMN: events[TIME_COLUMN][keep], "Event": names[keep]})
+
+
+def align_events(time: np.ndarray, event_times: np.ndarray, tolerance: float = None,
+                 direction: str = "nearest") -> np.ndarray:
+    """Find the sample row of each event by binary search on the sorted time axis.
+
+    Args:
+        time (np.ndarray): Sample times, sorted in ascending order
+        event_times (np.ndarray): Times of the events
+        tolerance (float, optional): Largest allowed distance between an event and its sample, within
+            the sampled time range. Events before the first or after the last sample take the boundary row,
+            e.g. a launch at t=0 of an export whose first row is later. Defaults to no limit.
+        direction (str, optional): 'nearest' sample or the 'preceding' one. Defaults to 'nearest'.
+
+    Returns:
+        np.ndarray: Row position of each event, or -1 where no sample is close enough
+    """
+    time = np.asarray(time, dtype=np.float64)
+    event_times = np.asarray(event_times, dtype=np.float64)
+    if len(time) == 0:
+        return np.full(len(event_times), -1, dtype=np.int64)
+
+    # Index of the last sample at or before each event
+    preceding = np.searchsorted(time, event_times, side="right") - 1
+    if direction == "preceding":
+        rows = preceding
+    elif direction == "nearest":
+        following = np.minimum(preceding + 1, len(time) - 1)
+        before = np.maximum(preceding, 0)
+        rows = np.where(
+            np.abs(time[following] - event_times) < np.abs(event_times - time[before]), following, before
+        )
+    else:
+        raise ValueError(f"Invalid direction '{direction}'. Please choose 'nearest' or 'preceding'.")
+
+    valid = rows >= 0
+    if tolerance is not None:
+        outside = (event_times < time[0]) | (event_times > time[-1])
+        valid &= outside | (np.abs(time[np.maximum(rows, 0)] - event_times) <= tolerance)
+    return np.where(valid, rows, -1).astype(np.int64)
+
+
+def event_tolerance(time: np.ndarray, intervals: float = EVENT_TOLERANCE_INTERVALS) -> float:
+    """Return the default event tolerance of a time axis, a few median sample intervals.
+
+    OpenRocket writes a sample at every event, so an event inside the sampled time range
+    but further than this from every sample is left unmatched. Events before the first
+    or after the last sample still take the boundary row, see align_events.
+
+    Args:
+        time (np.ndarray): Sample times, sorted in ascending order
+        intervals (float, optional): Tolerance in median sample intervals. Defaults to EVENT_TOLERANCE_INTERVALS.
+
+    Returns:
+        float: Largest allowed distance between an event and its sample (s), 0 for fewer than two samples
+    """
+    steps = np.diff(np.asarray(time, dtype=np.float64))
+    steps = steps[np.isfinite(steps)]
+    return float(intervals * np.median(steps)) if len(steps) else 0.0
+
+
+class EventRecord:
+    """State of the flight at the sample aligned with one simulation event."""
+
+    def __init__(self, name: str, row: int, time: float, mach: float, altitude: float, velocity: float) -> None:
+        """Initialise the EventRecord.
+
+        Args:
+            name (str): Event name, e.g. 'APOGEE'
+            row (int): Row position of the event in the merged data
+            time (float): Time of the event as written in the export (s)
+            mach (float): Mach number at the event
+            altitude (float): Altitude at the event (ft)
+            velocity (float): Total velocity at the event (m/s)
+        """
+        self.name = name
+        self.row = row
+        self.time = time
+        self.mach = mach
+        self.altitude = altitude
+        self.velocity = velocity
+
+
+class EventIndex:
+    """Lookup table from event name to the flight state at that event, built once per dataset."""
+
+    def __init__(self, records: list) -> None:
+        """Initialise the EventIndex.
+
+        Args:
+            records (list): EventRecord objects in flight order
+        """
+        self._records = {}
+        for record in records:
+            # Keep the first occurrence of each event
+            self._records.setdefault(record.name, record)
+
+    @classmethod
+    def from_frame(cls, merged_df: pd.DataFrame, events: pd.DataFrame, mach_column: str = MACH_COLUMN,
+                   tolerance: float = None) -> "EventIndex":
+        """Build the index by aligning an event table with the samples of a DataFrame.
+
+        Args:
+            merged_df (pd.DataFrame): Numeric rows sorted by time
+            events (pd.DataFrame): Event table with 'Time (s)' and 'Event' columns
+            mach_column (str, optional): Name of the Mach number column. Defaults to MACH_COLUMN.
+            tolerance (float, optional): Largest allowed distance between an event and its sample, np.inf for no limit.
+                Defaults to event_tolerance() of the time axis.
+
+        Returns:
+            EventIndex: Index of every event matched to a sample
+        """
+        event_times = events[TIME_COLUMN].to_numpy(dtype=np.float64)
+        time = merged_df[TIME_COLUMN].to_numpy()
+        if tolerance is None:
+            tolerance = event_tolerance(time)
+        rows = align_events(time, event_times, tolerance)
+        matched = rows >= 0
+        rows = rows[matched]
+        names = events["Event"].to_numpy()[matched]
+        times = event_times[matched]
+
+        def values_at(column):
+            if column not in merged_df.columns:
+                return np.full(len(rows), np.nan)
+            return merged_df[column].to_numpy()[rows]
+
+        machs = values_at(mach_column)
+        altitudes = values_at(ALTITUDE_COLUMN)
+        velocities = values_at(VELOCITY_COLUMN)
+        return cls(
+            [
+                EventRecord(str(names[i]), int(rows[i]), float(times[i]), float(machs[i]),
+                            float(altitudes[i]), float(velocities[i]))
+                for i in range(len(rows))
+            ]
+        )
+
+    def __contains__(self, event_name: str) -> bool:
+        return event_name in self._records
+
+    def names(self) -> list:
+        """Return the names of the indexed events in flight order."""
+        return list(self._records)
+
+    def get(self, event_name: str) -> EventRecord:
+        """Look up one event.
+
+        Args:
+            event_name (str): The name of the event to find
+
+        Returns:
+            EventRecord: The event, or None if it did not occur
+        """
+        return self._records.get(event_name)
+
+    def time(self, event_name: str) -> float:
+        """Return the time of an event, or None if it did not occur."""
+        record = self._records.get(event_name)
+        return record.time if record is not None else None
+
+    def mach(self, event_name: str) -> float:
+        """Return the Mach number at an event, or None if it did not occur."""
+        record = self._records.get(event_name)
+        return record.mach if record is not None else None
+
+    def events(self) -> pd.DataFrame:
+        """Return every event in one table.
+
+        Returns:
+            pd.DataFrame: One row per event with its row position, time, Mach, altitude and velocity
+        """
+        return pd.DataFrame(
+            [
+                {
+                    "Event": record.name,
+                    "Row": record.row,
+                    TIME_COLUMN: record.time,
+                    "Mach": record.mach,
+                    ALTITUDE_COLUMN: record.altitude,
+                    VELOCITY_COLUMN: record.velocity,
+                }
+                for record in self._records.values()
+            ],
+            columns=["Event", "Row", TIME_COLUMN, "Mach", ALTITUDE_COLUMN, VELOCITY_COLUMN],
+        )
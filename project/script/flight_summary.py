@@ -0,0 +1,238 @@
+import hashlib
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from flight_events import EventIndex, canonical_events
+from openrocket_parser import CHUNK_ROWS, OpenRocketExport, iter_openrocket_csv
+
+
+TIME_COLUMN = "Time (s)"
+ALTITUDE_COLUMN = "Altitude (ft)"
+VELOCITY_COLUMN = "Total velocity (m/s)"
+ACCELERATION_COLUMN = "Total acceleration (m/s²)"
+MACH_COLUMN = "Mach number ()"
+STABILITY_COLUMN = "Stability margin calibers ()"
+PRESSURE_COLUMN = "Air pressure (mbar)"
+TEMPERATURE_COLUMN = "Air temperature (°C)"
+
+LAUNCH_ROD_EVENT = "LAUNCHROD"
+BURNOUT_EVENT = "BURNOUT/EJECTION_CHARGE"
+
+# Specific gas constant of dry air (J/(kg·K))
+GAS_CONSTANT_AIR = 287.05
+
+# Number of summaries kept in memory, the least recently used are dropped first
+SUMMARY_CACHE_SIZE = 1024
+_summary_cache = OrderedDict()
+
+
+class FlightSummary:
+    """Key numbers of one simulated flight."""
+
+    def __init__(self, **values) -> None:
+        """Initialise the FlightSummary.
+
+        Args:
+            **values: Any of the summary fields, the rest are left as None
+        """
+        self.rows = None
+        self.apogee = None  # ft
+        self.apogee_time = None  # s
+        self.max_velocity = None  # m/s
+        self.max_acceleration = None  # m/s²
+        self.max_mach = None
+        self.min_stability = None  # cal
+        self.max_q = None  # Pa
+        self.max_q_time = None  # s
+        self.off_rod_velocity = None  # m/s
+        self.burnout_altitude = None  # ft
+        self.min_stability_powered = None  # cal, from leaving the launch rod to burnout
+        self.event_times = {}
+        for name, value in values.items():
+            setattr(self, name, value)
+
+    def as_dict(self) -> dict:
+        """Return the summary as a plain dictionary.
+
+        Returns:
+            dict: Field name to value
+        """
+        return dict(vars(self))
+
+
+class StreamingFlightSummary:
+    """Running flight aggregates updated block by block, in constant memory."""
+
+    def __init__(self) -> None:
+        """Initialise the aggregates before any block has been seen."""
+        self.rows = 0
+        self.apogee = -np.inf
+        self.apogee_time = None
+        self.max_velocity = -np.inf
+        self.max_acceleration = -np.inf
+        self.max_mach = -np.inf
+        self.min_stability = np.inf
+        self.event_times = {}
+
+    def update(self, block: OpenRocketExport) -> None:
+        """Fold one block of an export into the aggregates.
+
+        Args:
+            block (OpenRocketExport): Block of rows and the events written with it
+        """
+        columns = {name: i for i, name in enumerate(block.columns)}
+
+        def column(name):
+            return block.data[:, columns[name]] if name in columns else None
+
+        self.rows += len(block.data)
+        if len(block.data):
+            altitude = column(ALTITUDE_COLUMN)
+            if altitude is not None:
+                peak = np.fmax.reduce(altitude)
+                # The time is only looked up when the apogee moves, which is rare after the first blocks
+                if peak > self.apogee:
+                    self.apogee = float(peak)
+                    time = column(TIME_COLUMN)
+                    if time is not None:
+                        self.apogee_time = float(time[np.flatnonzero(altitude == peak)[0]])
+            self.max_velocity = self._fold(self.max_velocity, column(VELOCITY_COLUMN), np.fmax)
+            self.max_acceleration = self._fold(self.max_acceleration, column(ACCELERATION_COLUMN), np.fmax)
+            self.max_mach = self._fold(self.max_mach, column(MACH_COLUMN), np.fmax)
+            self.min_stability = self._fold(self.min_stability, column(STABILITY_COLUMN), np.fmin)
+
+        events = canonical_events(block.events)
+        for time, name in zip(events[TIME_COLUMN], events["Event"]):
+            self.event_times.setdefault(name, float(time))
+
+    @staticmethod
+    def _fold(current: float, values: np.ndarray, ufunc) -> float:
+        # fmax and fmin skip NaN, so blocks without data leave the aggregate untouched
+        if values is None:
+            return current
+        return float(ufunc(current, ufunc.reduce(values)))
+
+    def result(self) -> FlightSummary:
+        """Return the aggregates seen so far.
+
+        Returns:
+            FlightSummary: Summary with None for anything the export did not contain
+        """
+        def finite(value):
+            return value if np.isfinite(value) else None
+
+        return FlightSummary(
+            rows=self.rows,
+            apogee=finite(self.apogee),
+            apogee_time=self.apogee_time,
+            max_velocity=finite(self.max_velocity),
+            max_acceleration=finite(self.max_acceleration),
+            max_mach=finite(self.max_mach),
+            min_stability=finite(self.min_stability),
+            event_times=dict(self.event_times),
+        )
+
+
+def summarise_openrocket_csv(filepath: str, chunk_rows: int = CHUNK_ROWS) -> FlightSummary:
+    """Summarise an OpenRocket export while streaming it, without building a DataFrame.
+
+    Memory use is bounded by chunk_rows regardless of the size of the export.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        chunk_rows (int, optional): Number of data rows read at once. Defaults to CHUNK_ROWS.
+
+    Returns:
+        FlightSummary: Apogee, maximum velocity, acceleration and Mach, minimum stability and event times
+    """
+    summary = StreamingFlightSummary()
+    for block in iter_openrocket_csv(filepath, chunk_rows):
+        summary.update(block)
+    return summary.result()
+
+
+def dataset_hash(frame: pd.DataFrame) -> str:
+    """Hash the column names and values of a dataset.
+
+    Args:
+        frame (pd.DataFrame): Numeric dataset
+
+    Returns:
+        str: Hex digest identifying the dataset
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    for name in frame.columns:
+        digest.update(str(name).encode())
+        digest.update(np.ascontiguousarray(frame[name].to_numpy()).view(np.uint8))
+    return digest.hexdigest()
+
+
+def _peak(values: np.ndarray, ufunc) -> tuple:
+    """Return the NaN-skipping extreme of an array and its first row, or (None, None)."""
+    if values is None or len(values) == 0:
+        return None, None
+    peak = ufunc.reduce(values)
+    if np.isnan(peak):
+        return None, None
+    return float(peak), int(np.flatnonzero(values == peak)[0])
+
+
+def summarise_flight(merged_df: pd.DataFrame, event_index: EventIndex, key=None) -> FlightSummary:
+    """Summarise a flight with one vectorised reduction per metric over the merged data.
+
+    Windowed metrics use the event rows, e.g. the powered stability margin covers the rows
+    from leaving the launch rod to burnout. Results are memoised per dataset key.
+
+    Args:
+        merged_df (pd.DataFrame): Numeric rows sorted by time
+        event_index (EventIndex): Events aligned with the rows of merged_df
+        key (hashable, optional): Identifies the dataset and event alignment in the memo.
+            Defaults to dataset_hash(merged_df).
+
+    Returns:
+        FlightSummary: Key numbers of the flight, None for anything the data does not contain
+    """
+    key = key if key is not None else dataset_hash(merged_df)
+    if key in _summary_cache:
+        _summary_cache.move_to_end(key)
+        return _summary_cache[key]
+
+    def column(name):
+        return merged_df[name].to_numpy() if name in merged_df.columns else None
+
+    time = column(TIME_COLUMN)
+    summary = FlightSummary(rows=len(merged_df))
+    summary.apogee, apogee_row = _peak(column(ALTITUDE_COLUMN), np.fmax)
+    if apogee_row is not None and time is not None:
+        summary.apogee_time = float(time[apogee_row])
+    summary.max_velocity, _ = _peak(column(VELOCITY_COLUMN), np.fmax)
+    summary.max_acceleration, _ = _peak(column(ACCELERATION_COLUMN), np.fmax)
+    summary.max_mach, _ = _peak(column(MACH_COLUMN), np.fmax)
+    summary.min_stability, _ = _peak(column(STABILITY_COLUMN), np.fmin)
+
+    velocity = column(VELOCITY_COLUMN)
+    pressure = column(PRESSURE_COLUMN)
+    temperature = column(TEMPERATURE_COLUMN)
+    if velocity is not None and pressure is not None and temperature is not None:
+        # q = 1/2 rho v², with rho = p / (R T) from the simulated atmosphere
+        dynamic_pressure = 0.5 * (pressure * 100) / (GAS_CONSTANT_AIR * (temperature + 273.15)) * velocity ** 2
+        summary.max_q, max_q_row = _peak(dynamic_pressure, np.fmax)
+        if max_q_row is not None and time is not None:
+            summary.max_q_time = float(time[max_q_row])
+
+    launch_rod = event_index.get(LAUNCH_ROD_EVENT)
+    burnout = event_index.get(BURNOUT_EVENT)
+    if launch_rod is not None:
+        summary.off_rod_velocity = launch_rod.velocity
+    if burnout is not None:
+        summary.burnout_altitude = burnout.altitude
+    stability = column(STABILITY_COLUMN)
+    if launch_rod is not None and burnout is not None and stability is not None:
+        summary.min_stability_powered, _ = _peak(stability[launch_rod.row:burnout.row + 1], np.fmin)
+
+    summary.event_times = {name: event_index.time(name) for name in event_index.names()}
+
+    _summary_cache[key] = summary
+    if len(_summary_cache) > SUMMARY_CACHE_SIZE:
+        _summary_cache.popitem(last=False)
+    return summary
@@ -0,0 +1,261 @@
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from export_cache import CACHE_DIR
+
+
+JOB_DB = os.environ.get("AEROSPACE_JOB_DB", os.path.join(CACHE_DIR, "jobs.sqlite3"))
+# How long an idle worker waits before looking for new jobs again
+POLL_SECONDS = 0.2
+
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    filepath TEXT NOT NULL,
+    settings TEXT NOT NULL,
+    plots TEXT NOT NULL,
+    format TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    result TEXT,
+    created REAL NOT NULL,
+    started REAL,
+    finished REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created);
+"""
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    """Open the job database, creating it if needed."""
+    directory = os.path.dirname(db_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    connection = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    connection.row_factory = sqlite3.Row
+    # WAL lets pages poll the status while workers write results
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _claim(connection: sqlite3.Connection) -> sqlite3.Row:
+    """Take the oldest queued job and mark it running, or return None if there is none."""
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        job = connection.execute(
+            "SELECT * FROM jobs WHERE status = ? ORDER BY created LIMIT 1", (QUEUED,)
+        ).fetchone()
+        if job is not None:
+            connection.execute(
+                "UPDATE jobs SET status = ?, started = ? WHERE id = ?", (RUNNING, time.time(), job["id"])
+            )
+        connection.execute("COMMIT")
+        return job
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+
+
+def process_job(filepath: str, settings: dict, plots: list, format: str) -> dict:
+    """Parse an upload, build its Rocket dataset and render its plots into the plot cache.
+
+    Args:
+        filepath (str): Path to the uploaded OpenRocket CSV export
+        settings (dict): Plot settings to apply, as returned by Rocket.plot_settings
+        plots (list): Names of the plots to render
+        format (str): Image format
+
+    Returns:
+        dict: Path of each rendered plot and the flight summary
+    """
+    from rocket_web import Rocket
+
+    # Rocket reports read errors by printing them, a job should fail with the reason instead
+    if not os.path.isfile(filepath):
+        raise FileNotFoundError(f"No such upload: '{filepath}'")
+    rocket = Rocket(filepath)
+    rocket.apply_settings(settings)
+    paths = {plot: rocket.cached_plot(plot, format) for plot in plots}
+    return {"plots": paths, "summary": rocket.summary().as_dict()}
+
+
+def _worker_loop(db_path: str) -> None:
+    """Run jobs from the database until the process is terminated."""
+    connection = _connect(db_path)
+    while True:
+        job = _claim(connection)
+        if job is None:
+            time.sleep(POLL_SECONDS)
+            continue
+        try:
+            result = process_job(
+                job["filepath"], json.loads(job["settings"]), json.loads(job["plots"]), job["format"]
+            )
+            connection.execute(
+                "UPDATE jobs SET status = ?, result = ?, finished = ? WHERE id = ?",
+                (DONE, json.dumps(result, default=str), time.time(), job["id"]),
+            )
+        except Exception as e:
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished = ? WHERE id = ?",
+                (FAILED, f"{type(e).__name__}: {e}", time.time(), job["id"]),
+            )
+
+
+class JobQueue:
+    """Local queue of upload-processing jobs, brokered by SQLite and run by a pool of worker processes.
+
+    Requests only insert a job and read its row back, so their latency stays flat
+    however heavy the uploads being processed are. The database can be shared by
+    several web workers on one host.
+    """
+
+    def __init__(self, db_path: str = JOB_DB, workers: int = None) -> None:
+        """Initialise the JobQueue.
+
+        Args:
+            db_path (str, optional): Path of the SQLite job database. Defaults to JOB_DB.
+            workers (int, optional): Number of worker processes started by start(). Defaults to the number of CPUs.
+        """
+        self.db_path = db_path
+        self.workers = workers or os.cpu_count() or 1
+        self._local = threading.local()
+        self._processes = []
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        """sqlite3.Connection: Connection of the calling thread, as sqlite3 connections cannot be shared."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = _connect(self.db_path)
+        return connection
+
+    def start(self) -> None:
+        """Start the worker processes."""
+        # Spawned rather than forked, so workers never inherit the state of a threaded web server
+        context = multiprocessing.get_context("spawn")
+        for _ in range(self.workers):
+            process = context.Process(target=_worker_loop, args=(self.db_path,), daemon=True)
+            process.start()
+            self._processes.append(process)
+
+    def stop(self) -> None:
+        """Stop the worker processes. Jobs they were running stay running until requeue_stale()."""
+        for process in self._processes:
+            process.terminate()
+        for process in self._processes:
+            process.join()
+        self._processes = []
+
+    def requeue_stale(self, older_than: float) -> int:
+        """Queue again the jobs whose worker died while running them.
+
+        Args:
+            older_than (float): Seconds after which a running job is considered abandoned
+
+        Returns:
+            int: Number of jobs queued again
+        """
+        cursor = self._connection.execute(
+            "UPDATE jobs SET status = ?, started = NULL WHERE status = ? AND started < ?",
+            (QUEUED, RUNNING, time.time() - older_than),
+        )
+        return cursor.rowcount
+
+    def submit(self, filepath: str, settings: dict = None, plots: list = None, format: str = "png") -> str:
+        """Queue an uploaded export for processing.
+
+        Args:
+            filepath (str): Path the upload was saved to
+            settings (dict, optional): Plot settings to apply, e.g. {'MOTOR_NAME': 'M2100'}. Defaults to none.
+            plots (list, optional): Names of the plots to render. Defaults to every plot.
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: ID of the job
+
+        Raises:
+            ValueError: If a setting is unknown or its value is invalid
+        """
+        from rocket_web import PLOTS, Rocket
+
+        # Rejected at once rather than failing the job later, no data is loaded to check them
+        Rocket(filepath).apply_settings(settings or {})
+        if plots is None:
+            plots = PLOTS
+        job_id = uuid.uuid4().hex
+        self._connection.execute(
+            "INSERT INTO jobs (id, filepath, settings, plots, format, status, created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (job_id, filepath, json.dumps(settings or {}), json.dumps(list(plots)), format, QUEUED, time.time()),
+        )
+        return job_id
+
+    def status(self, job_id: str) -> dict:
+        """Return the status of a job, for the page to poll.
+
+        Args:
+            job_id (str): ID of the job
+
+        Returns:
+            dict: Status, error and timestamps of the job, or None if there is no such job
+        """
+        job = self._connection.execute(
+            "SELECT id, status, error, created, started, finished FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        return dict(job) if job is not None else None
+
+    def result(self, job_id: str) -> dict:
+        """Return the result of a job once it is done.
+
+        Args:
+            job_id (str): ID of the job
+
+        Returns:
+            dict: The job status, plus the rendered plot paths and flight summary when done,
+                or None if there is no such job
+        """
+        job = self._connection.execute(
+            "SELECT id, status, error, result FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+        if job is None:
+            return None
+        response = {"id": job["id"], "status": job["status"], "error": job["error"]}
+        if job["result"] is not None:
+            response.update(json.loads(job["result"]))
+        return response
+
+    def wait(self, job_id: str, timeout: float = None) -> dict:
+        """Block until a job is done or failed.
+
+        Args:
+            job_id (str): ID of the job
+            timeout (float, optional): Seconds to wait before giving up. Defaults to no limit.
+
+        Returns:
+            dict: The job result, see result()
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            status = self.status(job_id)
+            if status is None or status["status"] in (DONE, FAILED):
+                return self.result(job_id)
+            if deadline is not None and time.monotonic() > deadline:
+                return self.result(job_id)
+            time.sleep(POLL_SECONDS)
+
+    def __enter__(self) -> "JobQueue":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
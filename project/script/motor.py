@@ -0,0 +1,259 @@
+import csv
+import json
+import math
+import os
+import numpy as np
+from export_cache import ExportCache, default_cache, file_key
+
+
+# Upper total impulse bound of an A motor (Ns), each following letter doubles it
+IMPULSE_CLASS_BASE = 2.5
+
+# NumPy 2.0 renamed trapz to trapezoid
+trapezoid = getattr(np, "trapezoid", None) or np.trapz
+
+# Parsed motors by content key, so a known motor is never parsed or integrated twice
+_motors = {}
+
+
+def impulse_class(total_impulse: float) -> str:
+    """Return the NAR impulse class letter of a total impulse.
+
+    Args:
+        total_impulse (float): Total impulse (Ns)
+
+    Returns:
+        str: 'A' to 'Z', e.g. 'M' for 5120 to 10240 Ns
+    """
+    if total_impulse <= IMPULSE_CLASS_BASE:
+        return "A"
+    return chr(ord("A") + math.ceil(math.log2(total_impulse / IMPULSE_CLASS_BASE)))
+
+
+class Motor:
+    """Thrust curve of a rocket motor and the performance figures integrated from it."""
+
+    def __init__(self, name: str, time: np.ndarray, thrust: np.ndarray, metadata: dict = None,
+                 stats: dict = None) -> None:
+        """Initialise the Motor.
+
+        The curve is taken to start at ignition, (0 s, 0 N), as in RASP files, which is
+        added if the table does not start there itself.
+
+        Args:
+            name (str): Manufacturer and designation, e.g. 'AeroTech M2100G'
+            time (np.ndarray): Sample times (s), in ascending order
+            thrust (np.ndarray): Thrust at each sample (N)
+            metadata (dict, optional): Other header fields of the source file. Defaults to none.
+            stats (dict, optional): Previously computed figures, skipping the integration. Defaults to None.
+        """
+        time = np.asarray(time, dtype=np.float64)
+        thrust = np.asarray(thrust, dtype=np.float64)
+        if len(time) and time[0] > 0:
+            time = np.concatenate([[0.0], time])
+            thrust = np.concatenate([[0.0], thrust])
+        self.name = name
+        self.curve_time = time
+        self.curve_thrust = thrust
+        self.metadata = metadata or {}
+
+        if stats is None:
+            stats = self._integrate()
+        self.total_impulse = stats["total_impulse"]  # Ns
+        self.burn_time = stats["burn_time"]  # s
+        self.average_thrust = stats["average_thrust"]  # N
+        self.max_thrust = stats["max_thrust"]  # N
+
+    def _integrate(self) -> dict:
+        """Integrate the curve with the trapezoidal rule."""
+        if len(self.curve_time) < 2:
+            return {"total_impulse": 0.0, "burn_time": 0.0, "average_thrust": 0.0, "max_thrust": 0.0}
+        total_impulse = float(trapezoid(self.curve_thrust, self.curve_time))
+        # Burn time runs from ignition to the last sample still producing thrust, or the end of the curve
+        burning = np.flatnonzero(self.curve_thrust > 0)
+        last = min(burning[-1] + 1, len(self.curve_time) - 1) if len(burning) else 0
+        burn_time = float(self.curve_time[last] - self.curve_time[0])
+        return {
+            "total_impulse": total_impulse,
+            "burn_time": burn_time,
+            "average_thrust": total_impulse / burn_time if burn_time > 0 else 0.0,
+            "max_thrust": float(self.curve_thrust.max()),
+        }
+
+    @property
+    def manufacturer(self) -> str:
+        """str: Manufacturer, from the file header or else the first word of the motor name."""
+        if "manufacturer" in self.metadata:
+            return self.metadata["manufacturer"]
+        return self.name.split(" ", 1)[0] if " " in self.name else ""
+
+    @property
+    def designation(self) -> str:
+        """str: Motor designation, e.g. 'M2100G'."""
+        if "designation" in self.metadata:
+            return self.metadata["designation"]
+        return self.name.split(" ", 1)[-1]
+
+    @property
+    def impulse_class(self) -> str:
+        """str: Impulse class letter of the motor."""
+        return impulse_class(self.total_impulse)
+
+    def thrust(self, t) -> np.ndarray:
+        """Interpolate the thrust at any times.
+
+        Args:
+            t (float | np.ndarray): Times since ignition (s)
+
+        Returns:
+            np.ndarray: Thrust (N), zero before ignition and after burnout
+        """
+        return np.interp(t, self.curve_time, self.curve_thrust, left=0.0, right=0.0)
+
+    def stats(self) -> dict:
+        """Return the integrated performance figures.
+
+        Returns:
+            dict: Total impulse (Ns), burn time (s), average and maximum thrust (N)
+        """
+        return {
+            "total_impulse": self.total_impulse,
+            "burn_time": self.burn_time,
+            "average_thrust": self.average_thrust,
+            "max_thrust": self.max_thrust,
+        }
+
+
+def parse_thrustcurve_csv(filepath: str) -> Motor:
+    """Parse a ThrustCurve CSV export: quoted 'key:','value' header lines, then a time/thrust table.
+
+    Args:
+        filepath (str): Path to the ThrustCurve CSV file
+
+    Returns:
+        Motor: The motor and its integrated figures
+    """
+    with open(filepath, encoding="utf-8-sig") as handle:
+        lines = handle.read().splitlines()
+
+    metadata = {}
+    table_start = len(lines)
+    for i, row in enumerate(csv.reader(lines)):
+        if not row:
+            continue
+        if row[0].endswith(":"):
+            metadata[row[0][:-1].strip().lower()] = row[1].strip() if len(row) > 1 else ""
+            continue
+        # The first other row is the column header of the table
+        table_start = i + 1
+        break
+
+    table = np.loadtxt(lines[table_start:], delimiter=",", ndmin=2) if table_start < len(lines) else np.empty((0, 2))
+    if table.shape[1] != 2:
+        raise ValueError(f"Expected a time/thrust table, got {table.shape[1]} columns in '{filepath}'")
+    name = metadata.pop("motor", "")
+    return Motor(name, table[:, 0], table[:, 1], metadata)
+
+
+def parse_rasp_eng(filepath: str) -> list:
+    """Parse a RASP .eng file, which may hold several motors.
+
+    Each motor starts with a header line 'designation diameter length delays propellant-mass
+    total-mass manufacturer', followed by time/thrust pairs. Lines starting with ';' are comments.
+
+    Args:
+        filepath (str): Path to the .eng file
+
+    Returns:
+        list: Motor of each curve in the file
+    """
+    motors = []
+    header = None
+    samples = []
+
+    def finish():
+        if header is not None:
+            table = np.array(samples, dtype=np.float64).reshape(-1, 2)
+            motors.append(Motor(f"{header[6]} {header[0]}", table[:, 0], table[:, 1], {
+                "manufacturer": header[6],
+                "designation": header[0],
+                "diameter": float(header[1]),
+                "length": float(header[2]),
+                "delays": header[3],
+                "propellant_mass": float(header[4]),
+                "total_mass": float(header[5]),
+            }))
+
+    with open(filepath, encoding="utf-8-sig", errors="replace") as handle:
+        for line in handle:
+            line = line.split(";", 1)[0].strip()
+            if not line:
+                continue
+            fields = line.split()
+            # Sample lines hold two numbers, header lines seven fields
+            if len(fields) >= 7:
+                finish()
+                # Manufacturer names may contain spaces
+                header = fields[:6] + [" ".join(fields[6:])]
+                samples = []
+            elif header is not None:
+                samples.extend(float(field) for field in fields[:2])
+    finish()
+    return motors
+
+
+def read_motor_file(filepath: str) -> list:
+    """Parse a ThrustCurve CSV or RASP .eng file.
+
+    Args:
+        filepath (str): Path to the motor file
+
+    Returns:
+        list: Motor of each curve in the file
+    """
+    if os.path.splitext(filepath)[1].lower() == ".eng":
+        return parse_rasp_eng(filepath)
+    return [parse_thrustcurve_csv(filepath)]
+
+
+def _motor_to_arrays(motor: Motor) -> dict:
+    return {
+        "time": motor.curve_time,
+        "thrust": motor.curve_thrust,
+        "meta": np.array(json.dumps({"name": motor.name, "metadata": motor.metadata, "stats": motor.stats()})),
+    }
+
+
+def _motor_from_arrays(arrays: dict) -> Motor:
+    meta = json.loads(str(arrays["meta"]))
+    return Motor(meta["name"], arrays["time"], arrays["thrust"], meta["metadata"], meta["stats"])
+
+
+def load_motor(filepath: str, cache: ExportCache = None) -> Motor:
+    """Load a motor file, served from memory or the export cache when unchanged.
+
+    Args:
+        filepath (str): Path to the ThrustCurve CSV or RASP .eng file, of which the first motor is used
+        cache (ExportCache, optional): Cache to use. Defaults to the shared default_cache.
+
+    Returns:
+        Motor: The motor and its integrated figures
+
+    Raises:
+        ValueError: If the file holds no motors
+    """
+    cache = cache or default_cache
+    key = file_key(filepath, "motor")
+    if key in _motors:
+        return _motors[key]
+    arrays = cache.load(key)
+    if arrays is not None:
+        motor = _motor_from_arrays(arrays)
+    else:
+        motors = read_motor_file(filepath)
+        if not motors:
+            raise ValueError(f"No motors in '{filepath}'")
+        motor = motors[0]
+        cache.store(key, _motor_to_arrays(motor))
+    _motors[key] = motor
+    return motor
@@ -0,0 +1,218 @@
+import os
+import sqlite3
+import numpy as np
+from motor import Motor, read_motor_file
+
+
+LIBRARY_DB = "motors.sqlite3"
+MOTOR_EXTENSIONS = (".csv", ".eng")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS motors (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL REFERENCES files (path) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    manufacturer TEXT NOT NULL,
+    designation TEXT NOT NULL,
+    impulse_class TEXT NOT NULL,
+    total_impulse REAL NOT NULL,
+    average_thrust REAL NOT NULL,
+    burn_time REAL NOT NULL,
+    max_thrust REAL NOT NULL,
+    curve_time BLOB NOT NULL,
+    curve_thrust BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS motors_class_impulse ON motors (impulse_class, total_impulse);
+CREATE INDEX IF NOT EXISTS motors_impulse ON motors (total_impulse);
+CREATE INDEX IF NOT EXISTS motors_designation ON motors (designation COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS motors_path ON motors (path);
+"""
+SUMMARY_COLUMNS = [
+    "id", "path", "name", "manufacturer", "designation", "impulse_class",
+    "total_impulse", "average_thrust", "burn_time", "max_thrust",
+]
+
+# Query keyword to the SQL condition it adds
+RANGE_FILTERS = {
+    "min_impulse": "total_impulse >= ?",
+    "max_impulse": "total_impulse <= ?",
+    "min_thrust": "average_thrust >= ?",
+    "max_thrust": "average_thrust <= ?",
+    "min_burn_time": "burn_time >= ?",
+    "max_burn_time": "burn_time <= ?",
+    "impulse_class": "impulse_class = ?",
+    "manufacturer": "manufacturer = ? COLLATE NOCASE",
+    "designation": "designation = ? COLLATE NOCASE",
+}
+
+
+class MotorLibrary:
+    """Persistent SQLite index of a directory of ThrustCurve CSV and RASP .eng motor files.
+
+    The directory is scanned once, and every later refresh only parses files whose
+    size or modification time changed. Motor figures are indexed for range queries,
+    and thrust curves are stored pre-parsed so a motor loads without its source file.
+    """
+
+    def __init__(self, directory: str, db_path: str = None) -> None:
+        """Open the index of a motor directory, creating it if needed.
+
+        Args:
+            directory (str): Directory holding the motor files, searched recursively
+            db_path (str, optional): Path of the index. Defaults to LIBRARY_DB inside the directory.
+        """
+        self.directory = directory
+        self.db_path = db_path or os.path.join(directory, LIBRARY_DB)
+        self._connection = sqlite3.connect(self.db_path, isolation_level=None)
+        self._connection.row_factory = sqlite3.Row
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(SCHEMA)
+
+    def _scan(self) -> dict:
+        """Return the size and modification time of every motor file in the directory."""
+        files = {}
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.lower().endswith(MOTOR_EXTENSIONS):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    files[os.path.relpath(path, self.directory)] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def refresh(self) -> dict:
+        """Bring the index up to date with the directory, parsing only new and changed files.
+
+        Files that cannot be parsed as motors, e.g. simulation exports next to them, are
+        remembered so they are not parsed again until they change.
+
+        Returns:
+            dict: Number of files 'added', 'updated', 'removed' and 'unchanged'
+        """
+        on_disk = self._scan()
+        indexed = {
+            row["path"]: (row["size"], row["mtime_ns"])
+            for row in self._connection.execute("SELECT path, size, mtime_ns FROM files")
+        }
+        counts = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+        self._connection.execute("BEGIN")
+        try:
+            for path in indexed.keys() - on_disk.keys():
+                self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+                counts["removed"] += 1
+            for path, (size, mtime_ns) in on_disk.items():
+                if indexed.get(path) == (size, mtime_ns):
+                    counts["unchanged"] += 1
+                    continue
+                counts["updated" if path in indexed else "added"] += 1
+                self._index_file(path, size, mtime_ns)
+            self._connection.execute("COMMIT")
+        except Exception:
+            self._connection.execute("ROLLBACK")
+            raise
+        return counts
+
+    def _index_file(self, path: str, size: int, mtime_ns: int) -> None:
+        """Parse one motor file and replace its rows in the index."""
+        self._connection.execute("DELETE FROM files WHERE path = ?", (path,))
+        try:
+            motors = read_motor_file(os.path.join(self.directory, path))
+            error = None
+        except Exception as e:
+            motors = []
+            error = f"{type(e).__name__}: {e}"
+        self._connection.execute(
+            "INSERT INTO files (path, size, mtime_ns, error) VALUES (?, ?, ?, ?)", (path, size, mtime_ns, error)
+        )
+        self._connection.executemany(
+            "INSERT INTO motors (path, position, name, manufacturer, designation, impulse_class, total_impulse,"
+            " average_thrust, burn_time, max_thrust, curve_time, curve_thrust)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    path, position, motor.name, motor.manufacturer, motor.designation, motor.impulse_class,
+                    motor.total_impulse, motor.average_thrust, motor.burn_time, motor.max_thrust,
+                    motor.curve_time.tobytes(), motor.curve_thrust.tobytes(),
+                )
+                for position, motor in enumerate(motors)
+            ],
+        )
+
+    def query(self, **filters) -> list:
+        """Find motors by their figures, e.g. query(impulse_class='M', min_impulse=9000, max_impulse=10000).
+
+        Args:
+            **filters: Any of min_impulse/max_impulse (Ns), min_thrust/max_thrust (average, N),
+                min_burn_time/max_burn_time (s), impulse_class, manufacturer and designation
+
+        Returns:
+            list: One dict per matching motor with its figures and id, ordered by total impulse
+        """
+        unknown = filters.keys() - RANGE_FILTERS.keys()
+        if unknown:
+            raise ValueError(f"Invalid filters {sorted(unknown)}. Please choose from {', '.join(RANGE_FILTERS)}.")
+        conditions = [RANGE_FILTERS[name] for name in filters]
+        sql = f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM motors"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY total_impulse"
+        return [dict(row) for row in self._connection.execute(sql, list(filters.values()))]
+
+    def motor(self, motor_id: int) -> Motor:
+        """Load a motor from its pre-parsed curve, without reading its source file.
+
+        Args:
+            motor_id (int): id from query()
+
+        Returns:
+            Motor: The motor, or None if there is no such id
+        """
+        row = self._connection.execute("SELECT * FROM motors WHERE id = ?", (motor_id,)).fetchone()
+        if row is None:
+            return None
+        stats = {name: row[name] for name in ("total_impulse", "burn_time", "average_thrust", "max_thrust")}
+        return Motor(
+            row["name"],
+            np.frombuffer(row["curve_time"], dtype=np.float64),
+            np.frombuffer(row["curve_thrust"], dtype=np.float64),
+            {"path": row["path"], "manufacturer": row["manufacturer"], "designation": row["designation"]},
+            stats,
+        )
+
+    def get(self, designation: str) -> Motor:
+        """Load a motor by its designation, e.g. 'M2100G'.
+
+        Args:
+            designation (str): Motor designation, case-insensitive
+
+        Returns:
+            Motor: The first motor with that designation, or None if there is none
+        """
+        matches = self.query(designation=designation)
+        return self.motor(matches[0]["id"]) if matches else None
+
+    def close(self) -> None:
+        """Close the index."""
+        self._connection.close()
+
+
+def open_motor_library(directory: str, db_path: str = None) -> MotorLibrary:
+    """Open the index of a motor directory and bring it up to date.
+
+    Args:
+        directory (str): Directory holding the motor files
+        db_path (str, optional): Path of the index. Defaults to LIBRARY_DB inside the directory.
+
+    Returns:
+        MotorLibrary: The refreshed library
+    """
+    library = MotorLibrary(directory, db_path)
+    library.refresh()
+    return library
@@ -0,0 +1,292 @@
+import io
+import re
+import numpy as np
+import pandas as pd
+
+
+# "# Event LAUNCH occurred at t=0 seconds", the name is kept to its upper case words
+EVENT_PATTERN = re.compile(
+    r"#\s*Event\s+(?P<event>[A-Z_]+(?:\s+[A-Z_]+)*)\b.*?occurred at t=(?P<time>[\d\.]+(?:[eE][-+]?\d+)?)"
+)
+EVENT_MARKER = "occurred at t="
+# "# 3959 data points written for 54 variables."
+DATA_POINTS_PATTERN = re.compile(r"#\s*(\d+)\s+data points written for\s+(\d+)\s+variables")
+
+# Zero-width space, non-joiner, joiner and byte order mark
+ZERO_WIDTH_CHARACTERS = str.maketrans("", "", "\u200b\u200c\u200d\ufeff")
+
+# Number of data rows handed to the numeric parser at once
+CHUNK_ROWS = 65536
+
+
+class ExportPreamble:
+    """Metadata declared in the comment lines at the top of an OpenRocket CSV export."""
+
+    def __init__(self) -> None:
+        """Initialise an empty preamble, filled in line by line while reading."""
+        self.simulation_name = None
+        self.declared_rows = None
+        self.declared_columns = None
+        self.warnings = []
+        self.columns = None
+        self._in_warnings = False
+
+    def read_line(self, line: str) -> None:
+        """Update the preamble from one non-event comment line.
+
+        Args:
+            line (str): Comment line from the top of the export
+        """
+        text = line.lstrip("#").strip()
+        match = DATA_POINTS_PATTERN.match(line)
+        if match:
+            self.declared_rows = int(match.group(1))
+            self.declared_columns = int(match.group(2))
+        elif text == "Simulation warnings:":
+            self._in_warnings = True
+        elif not text:
+            self._in_warnings = False
+        elif self._in_warnings and line[1:].startswith("  "):
+            # Warnings are listed one per line, indented under the heading
+            self.warnings.append(text)
+        elif self.simulation_name is None and self.declared_rows is None:
+            self.simulation_name = text
+        else:
+            self._in_warnings = False
+            self.columns = parse_header(line)
+
+    def finish(self) -> None:
+        """Close the preamble once the first data row is reached.
+
+        Trimmed exports carry only the column header, which is then read as the
+        simulation name and has to be moved over to the columns.
+        """
+        if self.columns is None and self.simulation_name is not None:
+            self.columns = parse_header(self.simulation_name)
+            self.simulation_name = None
+
+
+class OpenRocketExport:
+    """Parsed contents of an OpenRocket CSV export."""
+
+    def __init__(self, preamble: ExportPreamble, data: np.ndarray, events: pd.DataFrame) -> None:
+        """Initialise the OpenRocketExport container.
+
+        Args:
+            preamble (ExportPreamble): Simulation name, declared sizes, warnings and column names
+            data (np.ndarray): float64 array of shape (rows, columns), one contiguous array per column
+            events (pd.DataFrame): Event table with 'Time (s)' and 'Event' columns
+        """
+        self.preamble = preamble
+        self.columns = preamble.columns
+        self.data = data
+        self.events = events
+        # Content hash of the source file, set when the export is loaded through the export cache
+        self.source_key = None
+
+    @property
+    def warnings(self) -> list:
+        """list: Simulation warnings listed in the export preamble."""
+        return self.preamble.warnings
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return the numeric rows as a DataFrame without copying the data.
+
+        Returns:
+            pd.DataFrame: DataFrame with one float64 column per exported variable
+        """
+        return pd.DataFrame(self.data, columns=self.columns, copy=False)
+
+
+def normalise_column_name(name: str) -> str:
+    """Return the canonical form of a column name.
+
+    OpenRocket writes dimensionless units as a zero-width space, e.g. 'Mach number (\u200b)',
+    which is removed so every reader agrees on 'Mach number ()'.
+
+    Args:
+        name (str): Column name as written in the export header
+
+    Returns:
+        str: Column name without zero-width characters or surrounding whitespace
+    """
+    return name.translate(ZERO_WIDTH_CHARACTERS).strip()
+
+
+def parse_header(line: str) -> list:
+    """Split the '# Time (s),Altitude (ft),...' header line into canonical column names.
+
+    Args:
+        line (str): Header line from the export preamble
+
+    Returns:
+        list: Column names with the leading comment marker and zero-width characters removed
+    """
+    return [normalise_column_name(name) for name in line.lstrip("#").strip().split(",")]
+
+
+def parse_events(lines: list) -> pd.DataFrame:
+    """Parse event comment lines into a typed event table with one vectorised regex pass.
+
+    Args:
+        lines (list): Comment lines of the form '# Event LAUNCH occurred at t=0 seconds'
+
+    Returns:
+        pd.DataFrame: Event table with float64 'Time (s)' and 'Event' columns
+    """
+    extracted = pd.Series(lines, dtype=object).str.extract(EVENT_PATTERN)
+    extracted = extracted.dropna()
+    return pd.DataFrame(
+        {
+            "Time (s)": extracted["time"].to_numpy(dtype=np.float64),
+            "Event": pd.Series(extracted["event"].to_numpy(dtype=object), dtype=object),
+        }
+    )
+
+
+def _parse_block(lines: list, n_columns: int) -> np.ndarray:
+    """Convert a block of comma separated data rows into a float64 array.
+
+    Args:
+        lines (list): Data rows as read from the file
+        n_columns (int): Number of columns declared by the header
+
+    Returns:
+        np.ndarray: Array of shape (len(lines), n_columns)
+    """
+    # The pandas C tokenizer converts a joined block far faster than np.loadtxt walks the lines
+    block = pd.read_csv(io.StringIO("".join(lines)), header=None, engine="c", dtype=np.float64)
+    return block.to_numpy(dtype=np.float64).reshape(-1, n_columns)
+
+
+def _read_comments(filepath: str, preamble: ExportPreamble) -> list:
+    """Route the comment lines of an export, filling in the preamble and collecting the events.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        preamble (ExportPreamble): Preamble to fill in
+
+    Returns:
+        list: Event comment lines
+    """
+    event_lines = []
+    started = False
+    # Data rows are only skipped here, so they are never decoded
+    with open(filepath, "rb") as handle:
+        for raw in handle:
+            if raw.startswith(b"#"):
+                line = raw.decode("utf-8")
+                if EVENT_MARKER in line:
+                    event_lines.append(line)
+                elif not started:
+                    preamble.read_line(line)
+            elif not started and raw.strip():
+                started = True
+    preamble.finish()
+    if preamble.columns is None:
+        raise ValueError(f"No column header found in {filepath}")
+    return event_lines
+
+
+def _parse_file(filepath: str, n_columns: int) -> np.ndarray:
+    """Convert every data row of an export into a float64 array with the pandas C tokenizer.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        n_columns (int): Number of columns declared by the header
+
+    Returns:
+        np.ndarray: Array of shape (rows, n_columns), one contiguous array per column
+    """
+    try:
+        frame = pd.read_csv(filepath, comment="#", header=None, engine="c", dtype=np.float64, encoding="utf-8")
+    except pd.errors.EmptyDataError:
+        return np.empty((0, n_columns), dtype=np.float64, order="F")
+    if frame.shape[1] != n_columns:
+        raise ValueError(f"Expected {n_columns} columns, found {frame.shape[1]} in {filepath}")
+    # A single float64 block is stored column by column, so this is a view in Fortran order
+    return np.asfortranarray(frame.to_numpy(dtype=np.float64))
+
+
+def _iter_blocks(filepath: str, preamble: ExportPreamble, chunk_rows: int):
+    """Route the lines of an export, filling in the preamble and yielding blocks of rows.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        preamble (ExportPreamble): Preamble to fill in, complete before the first block is yielded
+        chunk_rows (int): Number of data rows per block
+
+    Yields:
+        tuple: (data lines, event comment lines) read since the previous block
+    """
+    event_lines = []
+    block = []
+    started = False
+
+    with open(filepath, encoding="utf-8") as handle:
+        for line in handle:
+            if line.startswith("#"):
+                if EVENT_MARKER in line:
+                    event_lines.append(line)
+                elif not started:
+                    preamble.read_line(line)
+                continue
+            if not line.strip():
+                continue
+            if not started:
+                started = True
+                preamble.finish()
+                if preamble.columns is None:
+                    raise ValueError(f"No column header found in {filepath}")
+            block.append(line)
+            if len(block) >= chunk_rows:
+                yield block, event_lines
+                block, event_lines = [], []
+
+    if not started:
+        preamble.finish()
+        if preamble.columns is None:
+            raise ValueError(f"No column header found in {filepath}")
+    if block or event_lines:
+        yield block, event_lines
+
+
+def read_openrocket_csv(filepath: str) -> OpenRocketExport:
+    """Read an OpenRocket CSV export.
+
+    A scan over the raw lines parses the preamble for the simulation name, warnings,
+    column header and declared sizes, and collects the comment lines holding simulation
+    events, which are parsed into a typed event table in one pass. The numeric rows are
+    converted by the pandas C tokenizer in one call that skips every comment line, straight
+    into float64 column arrays, so the data is never held as strings in a DataFrame.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+
+    Returns:
+        OpenRocketExport: The parsed preamble, data and events
+    """
+    preamble = ExportPreamble()
+    event_lines = _read_comments(filepath, preamble)
+    data = _parse_file(filepath, len(preamble.columns))
+    return OpenRocketExport(preamble, data, parse_events(event_lines))
+
+
+def iter_openrocket_csv(filepath: str, chunk_rows: int = CHUNK_ROWS):
+    """Read an OpenRocket CSV export as a stream of fixed-size blocks in bounded memory.
+
+    Each block is an OpenRocketExport holding up to chunk_rows data rows and the
+    events written since the previous block. All blocks share the same preamble.
+
+    Args:
+        filepath (str): Path to the OpenRocket CSV export
+        chunk_rows (int, optional): Number of data rows per block. Defaults to CHUNK_ROWS.
+
+    Yields:
+        OpenRocketExport: The next block of the export
+    """
+    preamble = ExportPreamble()
+    for lines, block_events in _iter_blocks(filepath, preamble, chunk_rows):
+        n_columns = len(preamble.columns)
+        data = _parse_block(lines, n_columns) if lines else np.empty((0, n_columns), dtype=np.float64)
+        yield OpenRocketExport(preamble, data, parse_events(block_events))
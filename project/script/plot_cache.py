@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+import tempfile
+from export_cache import CACHE_DIR, evict_lru
+
+
+PLOT_CACHE_DIR = os.environ.get("AEROSPACE_PLOT_CACHE_DIR", os.path.join(CACHE_DIR, "plots"))
+# Total size of the rendered plots kept before the least recently used are evicted
+MAX_PLOT_CACHE_BYTES = int(float(os.environ.get("AEROSPACE_PLOT_CACHE_MAX_MB", 256)) * 1024 * 1024)
+PLOT_FORMATS = (".png", ".svg", ".svgz", ".pdf")
+
+
+def plot_key(dataset_key: str, plot: str, settings: dict, format: str = "png") -> str:
+    """Build the content address of a rendered plot.
+
+    Args:
+        dataset_key (str): Identifies the plotted data, e.g. Rocket.dataset_key
+        plot (str): Name of the plot
+        settings (dict): Every setting that changes the rendered output
+        format (str, optional): Image format. Defaults to 'png'.
+
+    Returns:
+        str: Hex digest of the data, plot, settings and format
+    """
+    description = json.dumps(
+        {"data": dataset_key, "plot": plot, "settings": settings, "format": format},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(description.encode()).hexdigest()
+
+
+class PlotCache:
+    """On-disk cache of rendered plots, one file per plot key.
+
+    Files are named after their key, so requests with different data or settings
+    never overwrite each other's plot, and identical requests share one file.
+    """
+
+    def __init__(self, cache_dir: str = PLOT_CACHE_DIR, max_bytes: int = MAX_PLOT_CACHE_BYTES) -> None:
+        """Initialise the PlotCache.
+
+        Args:
+            cache_dir (str, optional): Directory holding the rendered plots. Defaults to PLOT_CACHE_DIR.
+            max_bytes (int, optional): Size cap of the cache directory, 0 keeps only the latest plot.
+                Defaults to MAX_PLOT_CACHE_BYTES.
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def path(self, plot: str, key: str, format: str = "png") -> str:
+        """Return the file path of a plot key, whether or not it is cached.
+
+        Args:
+            plot (str): Name of the plot
+            key (str): Content address from plot_key
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Path of the cache entry
+        """
+        return os.path.join(self.cache_dir, f"{plot}_{key}.{format}")
+
+    def lookup(self, plot: str, key: str, format: str = "png") -> str:
+        """Find a rendered plot.
+
+        Args:
+            plot (str): Name of the plot
+            key (str): Content address from plot_key
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Path of the rendered plot, or None on a cache miss
+        """
+        if self.max_bytes <= 0:
+            return None
+        path = self.path(plot, key, format)
+        try:
+            # Touch the entry so eviction sees it as recently used
+            os.utime(path)
+            return path
+        except OSError:
+            return None
+
+    def store(self, plot: str, key: str, data: bytes, format: str = "png") -> str:
+        """Write a rendered plot and evict old plots beyond the size cap.
+
+        Args:
+            plot (str): Name of the plot
+            key (str): Content address from plot_key
+            data (bytes): The encoded image
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Path of the rendered plot
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(plot, key, format)
+        # Write to a temporary file first so concurrent readers never see a partial plot
+        handle, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+        evict_lru(self.cache_dir, self.max_bytes, PLOT_FORMATS, keep=os.path.basename(path))
+        return path
+
+    def get_or_render(self, plot: str, key: str, render, format: str = "png") -> str:
+        """Return the path of a rendered plot, rendering and storing it on a cache miss.
+
+        Args:
+            plot (str): Name of the plot
+            key (str): Content address from plot_key
+            render (callable): Function returning the encoded image
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Path of the rendered plot
+        """
+        return self.lookup(plot, key, format) or self.store(plot, key, render(), format)
+
+
+default_plot_cache = PlotCache()
@@ -0,0 +1,162 @@
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from contextlib import contextmanager
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+
+FIGURE_SIZE = (12, 6)
+
+
+def new_figure(figsize: tuple = FIGURE_SIZE) -> Figure:
+    """Create a figure with its own Agg canvas, outside of pyplot.
+
+    The figure is not registered with pyplot, so it holds no global state and is
+    freed as soon as it is no longer referenced.
+
+    Args:
+        figsize (tuple, optional): Width and height in inches. Defaults to FIGURE_SIZE.
+
+    Returns:
+        Figure: Empty figure ready to draw on
+    """
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def close_figure(fig: Figure) -> None:
+    """Release the artists of a figure, and with them the data they reference.
+
+    Args:
+        fig (Figure): Figure to close
+    """
+    fig.clear()
+
+
+@contextmanager
+def figure(figsize: tuple = FIGURE_SIZE):
+    """Context manager yielding a new figure that is closed on exit, even if drawing fails.
+
+    Args:
+        figsize (tuple, optional): Width and height in inches. Defaults to FIGURE_SIZE.
+
+    Yields:
+        Figure: Empty figure ready to draw on
+    """
+    fig = new_figure(figsize)
+    try:
+        yield fig
+    finally:
+        close_figure(fig)
+
+
+def figure_to_bytes(fig: Figure, format: str = "png", dpi: float = None) -> bytes:
+    """Render a figure into memory.
+
+    Args:
+        fig (Figure): Figure to render
+        format (str, optional): Any format supported by matplotlib, e.g. 'png' or 'svg'. Defaults to 'png'.
+        dpi (float, optional): Resolution. Defaults to the figure dpi.
+
+    Returns:
+        bytes: The encoded image
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=format, dpi=dpi)
+    return buffer.getvalue()
+
+
+def render_figure(draw, format: str = "png", dpi: float = None, figsize: tuple = FIGURE_SIZE) -> bytes:
+    """Draw one plot on a private figure and render it into memory.
+
+    Args:
+        draw (callable): Function drawing the plot onto the Figure it is given
+        format (str, optional): Image format. Defaults to 'png'.
+        dpi (float, optional): Resolution. Defaults to the figure dpi.
+        figsize (tuple, optional): Width and height in inches. Defaults to FIGURE_SIZE.
+
+    Returns:
+        bytes: The encoded image
+    """
+    with figure(figsize) as fig:
+        draw(fig)
+        return figure_to_bytes(fig, format, dpi)
+
+
+class PlotRenderer:
+    """Renders figures concurrently on a pool of threads, one private figure per plot.
+
+    Each render creates its own Figure and canvas and closes it when done, so
+    renders share no state and a long-running worker keeps flat memory.
+    """
+
+    def __init__(self, workers: int = None) -> None:
+        """Initialise the PlotRenderer.
+
+        Args:
+            workers (int, optional): Number of render threads. Defaults to the number of CPUs.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+
+    def render(self, draw, format: str = "png", dpi: float = None, figsize: tuple = FIGURE_SIZE) -> bytes:
+        """Draw and render one plot.
+
+        Args:
+            draw (callable): Function drawing the plot onto the Figure it is given
+            format (str, optional): Image format. Defaults to 'png'.
+            dpi (float, optional): Resolution. Defaults to the figure dpi.
+            figsize (tuple, optional): Width and height in inches. Defaults to FIGURE_SIZE.
+
+        Returns:
+            bytes: The encoded image
+        """
+        return render_figure(draw, format, dpi, figsize)
+
+    def render_many(self, draws: dict, format: str = "png", dpi: float = None) -> dict:
+        """Draw and render several plots at once on the thread pool.
+
+        Args:
+            draws (dict): Plot name to the function drawing it
+            format (str, optional): Image format. Defaults to 'png'.
+            dpi (float, optional): Resolution. Defaults to the figure dpi.
+
+        Returns:
+            dict: Plot name to the encoded image, in the order of draws
+        """
+        return self.run_many({name: partial(render_figure, draw, format, dpi) for name, draw in draws.items()})
+
+    def run_many(self, calls: dict) -> dict:
+        """Run several functions at once on the thread pool.
+
+        Args:
+            calls (dict): Name to a function taking no arguments
+
+        Returns:
+            dict: Name to the result of its function, in the order of calls
+        """
+        if self.workers == 1 or len(calls) <= 1:
+            return {name: call() for name, call in calls.items()}
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="plot-render")
+        futures = {name: self._pool.submit(call) for name, call in calls.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def close(self) -> None:
+        """Shut down the render threads."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "PlotRenderer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+# Shared renderer, its threads are started on first concurrent render
+default_renderer = PlotRenderer()
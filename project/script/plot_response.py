@@ -0,0 +1,84 @@
+import os
+
+
+# Browsers keep the plot but revalidate it with its ETag, which costs a 304 and no render
+CACHE_CONTROL = os.environ.get("AEROSPACE_PLOT_CACHE_CONTROL", "private, max-age=0, must-revalidate")
+
+CONTENT_TYPES = {
+    "png": "image/png",
+    "svg": "image/svg+xml",
+    "svgz": "image/svg+xml",
+    "pdf": "application/pdf",
+}
+REASONS = {200: "OK", 304: "Not Modified"}
+
+
+class PlotResponse:
+    """Rendered plot ready to be sent over HTTP, independent of any web framework.
+
+    The instance is also a WSGI application, so it can be returned from a WSGI
+    server directly or its body and headers copied into a framework response.
+    """
+
+    def __init__(self, body: bytes, headers: dict, status: int = 200) -> None:
+        """Initialise the PlotResponse.
+
+        Args:
+            body (bytes): The encoded image, empty for a 304
+            headers (dict): HTTP header name to value
+            status (int, optional): HTTP status code. Defaults to 200.
+        """
+        self.body = body
+        self.headers = headers
+        self.status = status
+
+    def __call__(self, environ: dict, start_response) -> list:
+        start_response(f"{self.status} {REASONS[self.status]}", list(self.headers.items()))
+        return [self.body]
+
+
+def etag_matches(etag: str, if_none_match: str) -> bool:
+    """Check an ETag against the value of an If-None-Match request header.
+
+    Args:
+        etag (str): Quoted ETag of the current plot
+        if_none_match (str): Header value, a list of ETags or '*'
+
+    Returns:
+        bool: True if the client already has the current plot
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def plot_response(key: str, render, format: str = "png", if_none_match: str = None,
+                  cache_control: str = CACHE_CONTROL) -> PlotResponse:
+    """Build the HTTP response of a plot, rendering it only if the client does not have it.
+
+    Args:
+        key (str): Content address of the plot, used as its ETag
+        render (callable): Function returning the encoded image
+        format (str, optional): 'png', 'svg', 'svgz' or 'pdf'. Defaults to 'png'.
+        if_none_match (str, optional): If-None-Match header of the request. Defaults to None.
+        cache_control (str, optional): Cache-Control header. Defaults to CACHE_CONTROL.
+
+    Returns:
+        PlotResponse: 200 with the image, or 304 with an empty body
+    """
+    if format not in CONTENT_TYPES:
+        raise ValueError(f"Invalid format '{format}'. Please choose one of {', '.join(CONTENT_TYPES)}.")
+    etag = f'"{key}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if etag_matches(etag, if_none_match):
+        return PlotResponse(b"", headers, status=304)
+
+    body = render()
+    headers["Content-Type"] = CONTENT_TYPES[format]
+    if format == "svgz":
+        # Compressed SVG is sent as SVG with a gzip content coding the browser unpacks
+        headers["Content-Encoding"] = "gzip"
+    headers["Content-Length"] = str(len(body))
+    return PlotResponse(body, headers)
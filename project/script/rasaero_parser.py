@@ -0,0 +1,258 @@
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from export_cache import CACHE_DIR, MAX_CACHE_BYTES, evict_lru
+
+
+MACH_COLUMN = "Mach"
+ALPHA_COLUMN = "Alpha"
+
+# RASAero writes angles of attack in whole degrees. Mach, the coefficients and the Reynolds
+# number are fractional and keep DEFAULT_DTYPE, as does any column whose values would not
+# survive the conversion to its dtype unchanged
+COLUMN_DTYPES = {
+    "Alpha": np.int16,
+}
+DEFAULT_DTYPE = np.float64
+
+# Sidecar caches live in the export cache directory, one per export path, and share its size cap
+SIDECAR_SUFFIX = ".aero.npz"
+# Bump whenever the reader changes what it produces, so stale sidecars are rebuilt
+SIDECAR_VERSION = 2
+
+
+class RASAeroExport:
+    """Columns of a RASAero aero-plot export, checked to lie on a Mach × Alpha grid."""
+
+    def __init__(self, columns: list, data: dict, missing_cells: int = 0) -> None:
+        """Initialise the RASAeroExport container.
+
+        Args:
+            columns (list): Column names, in file order
+            data (dict): One typed array per column
+            missing_cells (int, optional): Mach × Alpha cells the export has no row for. Defaults to 0.
+        """
+        self.columns = list(columns)
+        self.data = data
+        self.missing_cells = missing_cells
+
+    @property
+    def mach(self) -> np.ndarray:
+        """np.ndarray: Mach number of each row."""
+        return self.data[MACH_COLUMN]
+
+    @property
+    def alpha(self) -> np.ndarray:
+        """np.ndarray: Angle of attack of each row (deg)."""
+        return self.data[ALPHA_COLUMN]
+
+    def to_frame(self, columns: list = None) -> pd.DataFrame:
+        """Return the columns as a DataFrame without copying them.
+
+        Args:
+            columns (list, optional): Columns to include. Defaults to every column read.
+
+        Returns:
+            pd.DataFrame: One typed column per exported coefficient
+        """
+        columns = self.columns if columns is None else columns
+        return pd.DataFrame({name: self.data[name] for name in columns}, copy=False)
+
+
+def read_header(handle) -> list:
+    """Read the column header from the first line of an open export.
+
+    Args:
+        handle: Text file handle positioned at the start of the export
+
+    Returns:
+        list: Column names without quotes or surrounding whitespace
+    """
+    return [name.strip().strip('"').strip() for name in handle.readline().split(",")]
+
+
+def check_grid(mach: np.ndarray, alpha: np.ndarray) -> int:
+    """Check that rows come in one block per angle of attack, each in ascending Mach order.
+
+    This is how RASAero writes its exports, and what DragTable relies on to pivot them.
+
+    Args:
+        mach (np.ndarray): Mach number of each row
+        alpha (np.ndarray): Angle of attack of each row (deg)
+
+    Returns:
+        int: Number of Mach × Alpha cells without a row, e.g. a block ending one Mach number early
+    """
+    if len(mach) == 0:
+        raise ValueError("RASAero export has no data rows")
+    if not (np.isfinite(mach).all() and np.isfinite(alpha).all()):
+        raise ValueError("RASAero export has blank or non-finite Mach or Alpha values")
+    block_starts = np.flatnonzero(np.diff(alpha) != 0) + 1
+    block_alphas = alpha[np.concatenate([[0], block_starts])]
+    if len(np.unique(block_alphas)) != len(block_alphas):
+        raise ValueError("RASAero export rows are not grouped by Alpha")
+    # Mach may only fall where a new Alpha block starts
+    falls = np.flatnonzero(np.diff(mach) <= 0) + 1
+    if not np.isin(falls, block_starts).all():
+        row = falls[~np.isin(falls, block_starts)][0]
+        raise ValueError(f"Mach does not increase within its Alpha block at data row {row + 1}")
+    return len(np.unique(mach)) * len(block_alphas) - len(mach)
+
+
+def _typed_column(values: np.ndarray, dtype) -> np.ndarray:
+    """Convert a parsed column to its dtype, or keep DEFAULT_DTYPE if that would change a value."""
+    if np.dtype(dtype).kind in "iu":
+        if not np.isfinite(values).all():
+            return np.ascontiguousarray(values, dtype=DEFAULT_DTYPE)
+        typed = values.astype(dtype)
+        if not np.array_equal(typed, values):
+            return np.ascontiguousarray(values, dtype=DEFAULT_DTYPE)
+        return typed
+    return np.ascontiguousarray(values, dtype=dtype)
+
+
+def read_rasaero_csv(filepath: str, columns: list = None) -> RASAeroExport:
+    """Read a RASAero aero-plot CSV export with a fixed dtype per column.
+
+    Only the requested columns are converted, with NumPy's C float parser, which rounds
+    the 28 digit values RASAero writes correctly. Mach and Alpha are always read so the
+    grid can be checked before the export is returned.
+
+    Args:
+        filepath (str): Path to the RASAero CSV export
+        columns (list, optional): Columns to read. Defaults to every column.
+
+    Returns:
+        RASAeroExport: The typed columns
+    """
+    with open(filepath, encoding="utf-8-sig") as handle:
+        header = read_header(handle)
+        for name in (MACH_COLUMN, ALPHA_COLUMN):
+            if name not in header:
+                raise ValueError(f"Not a RASAero aero-plot export, '{name}' column missing: '{filepath}'")
+        columns = header if columns is None else list(columns)
+        unknown = [name for name in columns if name not in header]
+        if unknown:
+            raise ValueError(f"Invalid columns {unknown}. Please choose from {', '.join(header)}.")
+
+        names = [MACH_COLUMN, ALPHA_COLUMN] + [name for name in columns if name not in (MACH_COLUMN, ALPHA_COLUMN)]
+        usecols = [header.index(name) for name in names]
+        table = np.loadtxt(handle, delimiter=",", usecols=usecols, dtype=np.float64, ndmin=2)
+
+    data = {name: _typed_column(table[:, i], COLUMN_DTYPES.get(name, DEFAULT_DTYPE)) for i, name in enumerate(names)}
+    missing_cells = check_grid(data[MACH_COLUMN], data[ALPHA_COLUMN])
+    return RASAeroExport([name for name in header if name in data], data, missing_cells)
+
+
+def _projection(columns: list, wanted: list) -> list:
+    """Return Mach, Alpha and the wanted columns, in file order."""
+    return [name for name in columns if name in wanted or name in (MACH_COLUMN, ALPHA_COLUMN)]
+
+
+def sidecar_path(filepath: str, cache_dir: str) -> str:
+    """Return the sidecar path of an export, named after its absolute path.
+
+    Args:
+        filepath (str): Path to the RASAero CSV export
+        cache_dir (str): Directory of the export cache
+
+    Returns:
+        str: Path of the sidecar in the cache directory
+    """
+    name = hashlib.sha256(os.path.abspath(filepath).encode()).hexdigest()
+    return os.path.join(cache_dir, name + SIDECAR_SUFFIX)
+
+
+def _source_stat(filepath: str) -> dict:
+    stat = os.stat(filepath)
+    return {"version": SIDECAR_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _load_sidecar(path: str, source: dict, columns: list):
+    """Return the sidecar export if it is current and holds the columns, else the columns it holds."""
+    try:
+        with np.load(path, allow_pickle=False) as entry:
+            meta = json.loads(str(entry["meta"]))
+            if meta["source"] != source:
+                return None, []
+            stored = meta["columns"]
+            wanted = stored if columns is None else columns
+            if (columns is None and not meta["complete"]) or any(name not in stored for name in wanted):
+                return None, stored
+            # npz members are read lazily, so only the wanted columns are loaded
+            names = _projection(stored, wanted)
+            data = {name: entry[f"column_{stored.index(name)}"] for name in names}
+        return RASAeroExport(names, data, meta["missing_cells"]), stored
+    except (OSError, ValueError, KeyError):
+        return None, []
+
+
+def _store_sidecar(path: str, source: dict, export: RASAeroExport, complete: bool, max_bytes: int = None) -> None:
+    """Write the sidecar atomically, so concurrent readers never see a partial file.
+
+    If max_bytes is given, the least recently used entries of its directory are evicted beyond it,
+    export cache entries included, since sidecars count against the cap of the export cache.
+    """
+    meta = {
+        "source": source,
+        "columns": export.columns,
+        "complete": complete,
+        "missing_cells": export.missing_cells,
+    }
+    arrays = {f"column_{i}": export.data[name] for i, name in enumerate(export.columns)}
+    arrays["meta"] = np.array(json.dumps(meta))
+    directory = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        handle, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, "wb") as tmp:
+                np.savez(tmp, **arrays)
+            os.replace(tmp_path, path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+        if max_bytes is not None:
+            # Same suffix as the export cache entries, so both are evicted against one cap
+            evict_lru(directory, max_bytes, (".npz",), keep=os.path.basename(path))
+    except OSError as e:
+        print(f"Error writing the RASAero sidecar cache: {e}")
+
+
+def load_rasaero_export(filepath: str, columns: list = None, sidecar: str = None) -> RASAeroExport:
+    """Read a RASAero aero-plot export, served from its binary sidecar cache when unchanged.
+
+    Sidecars are kept in the export cache directory, so exports in read-only or shared
+    folders are cached too, and share its size cap. The sidecar is rebuilt when the size
+    or modification time of the export changes. A request for columns the sidecar does
+    not hold yet parses them and adds them to it.
+
+    Args:
+        filepath (str): Path to the RASAero CSV export
+        columns (list, optional): Columns to read. Defaults to every column.
+        sidecar (str, optional): Path of the sidecar. Defaults to sidecar_path() in the export cache.
+
+    Returns:
+        RASAeroExport: The typed columns
+    """
+    max_bytes = None
+    if sidecar is None:
+        if MAX_CACHE_BYTES <= 0:
+            return read_rasaero_csv(filepath, columns)
+        sidecar, max_bytes = sidecar_path(filepath, CACHE_DIR), MAX_CACHE_BYTES
+    source = _source_stat(filepath)
+    export, stored = _load_sidecar(sidecar, source, columns)
+    if export is not None:
+        return export
+
+    if columns is None:
+        export = read_rasaero_csv(filepath)
+        _store_sidecar(sidecar, source, export, True, max_bytes)
+        return export
+    export = read_rasaero_csv(filepath, list(dict.fromkeys(stored + list(columns))))
+    _store_sidecar(sidecar, source, export, False, max_bytes)
+    wanted = _projection(export.columns, columns)
+    return RASAeroExport(wanted, {name: export.data[name] for name in wanted}, export.missing_cells)
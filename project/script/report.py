@@ -0,0 +1,165 @@
+import os
+import time
+from functools import partial
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+from plot_renderer import PlotRenderer, close_figure, default_renderer, new_figure
+
+
+REPORT_FORMATS = ("pdf", "png", "svg")
+
+
+class PlotTiming:
+    """Time spent on one plot of a report."""
+
+    def __init__(self, plot: str, draw_seconds: float, write_seconds: float, path: str) -> None:
+        """Initialise the PlotTiming.
+
+        Args:
+            plot (str): Name of the plot
+            draw_seconds (float): Wall time spent drawing the figure
+            write_seconds (float): Wall time spent rendering it, and writing it out if it has its own file
+            path (str): File the plot was written to
+        """
+        self.plot = plot
+        self.draw_seconds = draw_seconds
+        self.write_seconds = write_seconds
+        self.path = path
+
+    @property
+    def seconds(self) -> float:
+        """float: Total time spent on the plot."""
+        return self.draw_seconds + self.write_seconds
+
+
+class Report:
+    """Files written for a report and how long each plot took."""
+
+    def __init__(self, paths: list, plot_timings: list, seconds: float) -> None:
+        """Initialise the Report.
+
+        Args:
+            paths (list): Files written, one PDF or one image per plot
+            plot_timings (list): PlotTiming of each plot in report order
+            seconds (float): Wall time of the whole report
+        """
+        self.paths = paths
+        self.plot_timings = plot_timings
+        self.seconds = seconds
+
+    def timings(self) -> pd.DataFrame:
+        """Return the per-plot timings as a table.
+
+        Returns:
+            pd.DataFrame: One row per plot with its draw, write and total time and output path
+        """
+        return pd.DataFrame(
+            [
+                {
+                    "Plot": timing.plot,
+                    "Draw seconds": timing.draw_seconds,
+                    "Write seconds": timing.write_seconds,
+                    "Seconds": timing.seconds,
+                    "Path": timing.path,
+                }
+                for timing in self.plot_timings
+            ],
+            columns=["Plot", "Draw seconds", "Write seconds", "Seconds", "Path"],
+        )
+
+
+def _draw(draw) -> tuple:
+    """Draw one plot onto a new figure.
+
+    Returns:
+        tuple: (figure, seconds)
+    """
+    start = time.perf_counter()
+    fig = new_figure()
+    try:
+        draw(fig)
+    except Exception:
+        close_figure(fig)
+        raise
+    return fig, time.perf_counter() - start
+
+
+def _write_image(name: str, draw, path: str, format: str) -> PlotTiming:
+    """Draw one plot and write it to its own image file."""
+    fig, draw_seconds = _draw(draw)
+    start = time.perf_counter()
+    try:
+        fig.savefig(path, format=format)
+    finally:
+        close_figure(fig)
+    return PlotTiming(name, draw_seconds, time.perf_counter() - start, path)
+
+
+def _draw_page(draw) -> tuple:
+    """Draw one plot, handing back the error instead of raising it so every figure can be closed.
+
+    Returns:
+        tuple: (figure, seconds, None), or (None, 0, exception) if drawing failed
+    """
+    try:
+        fig, seconds = _draw(draw)
+    except Exception as e:
+        return None, 0.0, e
+    return fig, seconds, None
+
+
+def render_report(draws: dict, output_path: str, format: str = "pdf", renderer: PlotRenderer = None) -> Report:
+    """Draw and render several plots at once and write them out as one report.
+
+    Every plot is drawn on its own figure by the renderer's pool. With 'png' or 'svg'
+    each plot is also written to its own file in output_path as a directory, and its
+    figure closed, on the pool. With 'pdf' the drawn figures are written as pages of
+    one file by PdfPages in report order, which only one thread can do. Every figure is
+    closed once written, and all of them are closed if any plot fails.
+
+    Args:
+        draws (dict): Plot name to the function drawing it onto the Figure it is given
+        output_path (str): PDF file, or directory for an image set
+        format (str, optional): 'pdf', 'png' or 'svg'. Defaults to 'pdf'.
+        renderer (PlotRenderer, optional): Thread pool to render on. Defaults to the shared default_renderer.
+
+    Returns:
+        Report: The files written and per-plot timings
+    """
+    if format not in REPORT_FORMATS:
+        raise ValueError(f"Invalid report format '{format}'. Please choose one of {', '.join(REPORT_FORMATS)}.")
+    renderer = renderer or default_renderer
+    start = time.perf_counter()
+
+    if format != "pdf":
+        os.makedirs(output_path, exist_ok=True)
+        timings = renderer.run_many(
+            {
+                name: partial(_write_image, name, draw, os.path.join(output_path, f"{name}.{format}"), format)
+                for name, draw in draws.items()
+            }
+        )
+        plot_timings = list(timings.values())
+        return Report([timing.path for timing in plot_timings], plot_timings, time.perf_counter() - start)
+
+    pages = renderer.run_many({name: partial(_draw_page, draw) for name, draw in draws.items()})
+    try:
+        errors = [error for _, _, error in pages.values() if error is not None]
+        if errors:
+            raise errors[0]
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        plot_timings = []
+        with PdfPages(output_path) as pdf:
+            for name, (fig, draw_seconds, _) in pages.items():
+                write_start = time.perf_counter()
+                pdf.savefig(fig)
+                plot_timings.append(PlotTiming(name, draw_seconds, time.perf_counter() - write_start, output_path))
+            if pdf.get_pagecount() != len(pages):
+                raise RuntimeError(f"Report '{output_path}' has {pdf.get_pagecount()} pages, expected {len(pages)}")
+    finally:
+        for fig, _, _ in pages.values():
+            if fig is not None:
+                close_figure(fig)
+    return Report([output_path], plot_timings, time.perf_counter() - start)
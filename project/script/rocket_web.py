@@ -1,36 +1,75 @@
 import pandas as pd
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')
-import matplotlib.pyplot as plt
-import re
 import math
 import os
-# from django.conf import settings
+from column_store import open_column_store
+from decimation import DECIMATION_THRESHOLD, decimate
+from export_cache import load_openrocket_csv
+from flight_events import EventIndex, canonical_events
+from flight_summary import FlightSummary, dataset_hash, summarise_flight
+from motor import Motor, load_motor
+from openrocket_parser import OpenRocketExport
+from plot_cache import PlotCache, default_plot_cache, plot_key
+from plot_renderer import PlotRenderer, default_renderer, figure
+from plot_response import PlotResponse, plot_response
+from report import Report, render_report
+
+try:
+    from django.conf import settings
+    from django.core.exceptions import ImproperlyConfigured
+except ImportError:
+    # Outside the Django site, e.g. in batch_report and job_queue workers
+    settings = None
+
+
+PLOTS = ["Flight_Profile", "Stability", "DragCoefficient"]
+
+
+def media_plot_cache() -> PlotCache:
+    """Return the plot cache saved plots go to, 'plots' under MEDIA_ROOT so they can be served as media.
+
+    Returns:
+        PlotCache: The MEDIA_ROOT cache in a Django site, else default_plot_cache
+    """
+    if settings is None:
+        return default_plot_cache
+    try:
+        # Reading a setting loads DJANGO_SETTINGS_MODULE, which spawned workers have not done yet
+        media_root = settings.MEDIA_ROOT
+    except ImproperlyConfigured:
+        return default_plot_cache
+    return PlotCache(os.path.join(media_root, "plots")) if media_root else default_plot_cache
 
 
 class Rocket:
     """Rocket class for plotting data from a CSV file."""
 
-    def __init__(self, filepath: str) -> None:
+    def __init__(self, filepath: str, lazy: bool = False) -> None:
         """Initialise the Rocket class for plotting data from a CSV file.
 
         Args:
             filepath (str):  The path to the CSV file containing the data.
+            lazy (bool, optional):  Page columns in from a memory-mapped column store only when used. Defaults to False.
         """
         # Default values for constants
         self.DATA_FILEPATH = filepath
+        self.LAZY = lazy
         self.MOTOR_NAME = "Motor Name"
         self.ROCKET_LENGTH = 2000
         self.ALTITUDE_INCREMENTS = 1000
         self.VERTICAL_MOTION_INCREMENTS = 50
         self.AVERAGE_THRUST = 0
+        self.MOTOR = None  # Motor loaded by set_motor_file
         self.OUTPUT_FOLDER_PATH = r"project\output"
         self.STABILITY_UNIT = 'cal'  # 'cal' or '%'
         self.SHOW_FULL_STABILITY_GRAPH = True  # True or False
+        self.EVENT_TOLERANCE = None  # Largest gap (s) between an event and its sample, None for two median sample intervals
+        self.DECIMATION_MODE = "minmax"  # 'minmax' or 'lttb'
+        self.DECIMATION_THRESHOLD = DECIMATION_THRESHOLD  # Series longer than this are decimated
 
         # Save
         self.PLOT_SAVE = False
+        self.PLOT_CACHE = media_plot_cache()  # Where saved plots are kept, one file per data and settings
         # Events
         self.DISPLAY_MOTOR_BURNOUT = False
         self.DISPLAY_LAUNCH = False
@@ -38,22 +77,183 @@ class Rocket:
         self.DISPLAY_GROUND_HIT = False
         self.DISPLAY_LAUNCH_ROD = False
 
-        # Load data
-        self.df = self.read_csv_file()
-        self.comments_df = self.extract_comments()
-        self.filtered_df = self.filter_comments_from_csv()
-        self.merged_df = self.merge_dataframes()
-        
+        # Data is loaded on first use, see the properties below
+        self._frames = {}
+
+    def _cached(self, name: str, build) -> object:
+        """Return a cached frame, building it with the given method on first use.
+
+        Args:
+            name (str): Name of the frame
+            build (callable): Method that builds the frame
+
+        Returns:
+            object: The cached frame
+        """
+        if name not in self._frames:
+            self._frames[name] = build()
+        return self._frames[name]
+
+    @property
+    def export(self) -> OpenRocketExport:
+        """OpenRocketExport: The parsed CSV file, read on first use."""
+        return self._cached("export", self.read_csv_file)
+
+    @property
+    def comments_df(self) -> pd.DataFrame:
+        """pd.DataFrame: The events of the CSV file, extracted on first use."""
+        return self._cached("comments_df", self.extract_comments)
+
+    @property
+    def filtered_df(self) -> pd.DataFrame:
+        """pd.DataFrame: The numeric rows of the CSV file, built on first use."""
+        return self._cached("filtered_df", self.filter_comments_from_csv)
+
+    @property
+    def merged_df(self) -> pd.DataFrame:
+        """pd.DataFrame: The numeric rows with events attached, built on first use."""
+        return self._cached("merged_df", self.merge_dataframes)
+
+    @property
+    def event_index(self) -> EventIndex:
+        """EventIndex: The flight state at each event, built once from merged_df."""
+        return self._cached("event_index", self.build_event_index)
+
+    @property
+    def dataset_key(self) -> str:
+        """str: Identifies the loaded data, the export cache key or else a hash of merged_df."""
+        return self._cached("dataset_key", lambda: self.export.source_key or dataset_hash(self.merged_df))
+
+    def release(self) -> None:
+        """Drop the loaded data, keeping only the event index and the dataset key.
+        merged_df and filtered_df are views of the export's column buffer, so all of them
+        are dropped together, which frees the buffer. They are reloaded from the export
+        cache if used again."""
+        for name in ("export", "comments_df", "filtered_df", "merged_df"):
+            self._frames.pop(name, None)
+
+
+    def save_plot(self, plot, format="png"):
+        """Save a plot into the plot cache, which must live under MEDIA_ROOT, and return its URL.
+
+        Repeat requests for the same data and settings are served from the cached file without rendering.
+
+        Args:
+            plot (str): 'Flight_Profile', 'Stability' or 'DragCoefficient'
+            format (str, optional): Image format. Defaults to 'png'.
 
-    def save_plot(self, fig, plot_name):
+        Returns:
+            str: URL of the plot, or None if it could not be saved
+        """
         try:
-            media_path = settings.MEDIA_ROOT
-            plot_path = os.path.join(media_path, plot_name)
-            fig.savefig(plot_path)
-            return os.path.join(settings.MEDIA_URL, plot_name)
+            plot_path = os.path.relpath(self.cached_plot(plot, format), settings.MEDIA_ROOT)
+            if plot_path.startswith(os.pardir):
+                raise ValueError(f"Plot cache '{self.PLOT_CACHE.cache_dir}' is not under MEDIA_ROOT")
+            return os.path.join(settings.MEDIA_URL, plot_path)
         except Exception as e:
             print(f"Error saving plot: {e}")
             return None
+
+    def plot_response(self, plot: str, format: str = "png", if_none_match: str = None) -> PlotResponse:
+        """Render a plot into memory for streaming straight into an HTTP response.
+
+        Nothing is written to disk: the plot is read from the plot cache if it is already there,
+        otherwise rendered into memory. A request whose If-None-Match holds the current ETag
+        gets a 304 without rendering.
+
+        Args:
+            plot (str): 'Flight_Profile', 'Stability' or 'DragCoefficient'
+            format (str, optional): 'png', 'svg', 'svgz' or 'pdf'. Defaults to 'png'.
+            if_none_match (str, optional): If-None-Match header of the request. Defaults to None.
+
+        Returns:
+            PlotResponse: Status, headers and body of the response
+        """
+        self._drawer(plot)
+        key = self.plot_key(plot, format)
+
+        def render():
+            plot_path = self.PLOT_CACHE.lookup(plot, key, format)
+            if plot_path is not None:
+                try:
+                    with open(plot_path, "rb") as handle:
+                        return handle.read()
+                except OSError:
+                    # Evicted since the lookup
+                    pass
+            return self.render_plot(plot, format)
+
+        return plot_response(key, render, format, if_none_match)
+
+    def plot_settings(self) -> dict:
+        """Return every setting that changes the rendered plots.
+
+        Returns:
+            dict: Setting name to value
+        """
+        return {
+            "MOTOR_NAME": self.MOTOR_NAME,
+            "ROCKET_LENGTH": self.ROCKET_LENGTH,
+            "ALTITUDE_INCREMENTS": self.ALTITUDE_INCREMENTS,
+            "VERTICAL_MOTION_INCREMENTS": self.VERTICAL_MOTION_INCREMENTS,
+            "STABILITY_UNIT": self.STABILITY_UNIT,
+            "SHOW_FULL_STABILITY_GRAPH": self.SHOW_FULL_STABILITY_GRAPH,
+            "EVENT_TOLERANCE": self.EVENT_TOLERANCE,
+            "DECIMATION_MODE": self.DECIMATION_MODE,
+            "DECIMATION_THRESHOLD": self.DECIMATION_THRESHOLD,
+            "DISPLAY_MOTOR_BURNOUT": self.DISPLAY_MOTOR_BURNOUT,
+            "DISPLAY_LAUNCH": self.DISPLAY_LAUNCH,
+            "DISPLAY_APOGEE": self.DISPLAY_APOGEE,
+            "DISPLAY_GROUND_HIT": self.DISPLAY_GROUND_HIT,
+            "DISPLAY_LAUNCH_ROD": self.DISPLAY_LAUNCH_ROD,
+        }
+
+    def apply_settings(self, settings: dict) -> None:
+        """Apply plot settings through their setters, so every value is validated.
+
+        Args:
+            settings (dict): Setting name to value, as returned by plot_settings
+
+        Raises:
+            ValueError: If a setting is unknown or its value is invalid
+        """
+        allowed = self.plot_settings()
+        for name, value in settings.items():
+            if name not in allowed:
+                raise ValueError(f"Unknown plot setting '{name}'.")
+            # Setters are named after the setting, e.g. set_stability_unit or set_DISPLAY_APOGEE
+            setter = getattr(self, f"set_{name}", None) or getattr(self, f"set_{name.lower()}")
+            setter(value)
+            # Some setters only print a message and keep the old value when given an invalid one
+            if getattr(self, name) != value:
+                raise ValueError(f"Invalid value {value!r} for plot setting '{name}'.")
+
+    def plot_key(self, plot: str, format: str = "png") -> str:
+        """Return the content address of a plot for the current data and settings.
+
+        Args:
+            plot (str): 'Flight_Profile', 'Stability' or 'DragCoefficient'
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Hex digest identifying the rendered plot
+        """
+        return plot_key(self.dataset_key, plot, self.plot_settings(), format)
+
+    def cached_plot(self, plot: str, format: str = "png") -> str:
+        """Return the path of a rendered plot in the plot cache, rendering it on a cache miss.
+
+        Args:
+            plot (str): 'Flight_Profile', 'Stability' or 'DragCoefficient'
+            format (str, optional): Image format. Defaults to 'png'.
+
+        Returns:
+            str: Path of the rendered plot
+        """
+        self._drawer(plot)
+        return self.PLOT_CACHE.get_or_render(
+            plot, self.plot_key(plot, format), lambda: self.render_plot(plot, format), format
+        )
         
 
     def delete_temporary_file(self,file_path):
@@ -99,6 +299,35 @@ class Rocket:
         for _, row in self.comments_df.iterrows():
             print(row_format.format(*row))
 
+    def set_event_tolerance(self, tolerance: float) -> None:
+        """Set the EVENT_TOLERANCE variable and rebuild the event index on next use.
+
+        Args:
+            tolerance (float): Largest gap (s) between an event and the sample it is attached to,
+                None for two median sample intervals (see flight_events.event_tolerance), np.inf for no limit
+        """
+        self.EVENT_TOLERANCE = tolerance
+        self._frames.pop("event_index", None)
+
+    def set_decimation_mode(self, mode: str) -> None:
+        """Set the DECIMATION_MODE variable to either 'minmax' or 'lttb'.
+
+        Args:
+            mode (str): 'minmax' keeps the extremes of every pixel column, 'lttb' keeps the visual shape with fewer points
+        """
+        if mode in ["minmax", "lttb"]:
+            self.DECIMATION_MODE = mode
+        else:
+            raise ValueError("Invalid decimation mode. Please choose 'minmax' or 'lttb'.")
+
+    def set_decimation_threshold(self, threshold: int) -> None:
+        """Set the DECIMATION_THRESHOLD variable.
+
+        Args:
+            threshold (int): Series with more samples than this are decimated before plotting
+        """
+        self.DECIMATION_THRESHOLD = threshold
+
     def set_PLOT_SAVE(self, state: bool) -> None:
         """Set the PLOT_SAVE constant to True or False.
 
@@ -107,6 +336,14 @@ class Rocket:
         """
         self.PLOT_SAVE = state
 
+    def set_plot_cache(self, cache) -> None:
+        """Set the PLOT_CACHE variable.
+
+        Args:
+            cache (PlotCache): Cache saved plots are written to, e.g. PlotCache(os.path.join(settings.MEDIA_ROOT, "plots"))
+        """
+        self.PLOT_CACHE = cache
+
     def set_DISPLAY_MOTOR_BURNOUT(self, state: bool) -> None:
         """Set the DISPLAY_MOTOR_BURNOUT constant to True or False.
 
@@ -149,11 +386,13 @@ class Rocket:
 
     def set_data_file_Path(self, filepath: str) -> None:
         """Set the DATA_FILEPATH constant to the given filepath.
+        Any data loaded from the previous file is dropped.
 
         Args:
-            filepath (str):  _description_
+            filepath (str):  Path to the CSV file containing the data
         """
         self.DATA_FILEPATH = filepath
+        self._frames = {}
 
     def set_motor_name(self, motor_name: str) -> None:
         """Set the MOTOR_NAME constant to the given motor name.
@@ -195,50 +434,58 @@ class Rocket:
         """
         self.AVERAGE_THRUST = average_thrust
 
-    def set_output_folder_path(self, path: str) -> None:
-        """Set the OUTPUT_FOLDER_PATH constant to the given path.
+    def set_motor_file(self, filepath: str) -> Motor:
+        """Load a ThrustCurve CSV file and set the MOTOR, MOTOR_NAME and AVERAGE_THRUST constants from it.
 
         Args:
-            path (str):  Output folder path
-        """
-        self.OUTPUT_FOLDER_PATH = path
-
-    def read_csv_file(self) -> pd.DataFrame:
-        """Read the CSV file and return a DataFrame.
+            filepath (str):  Path to the ThrustCurve CSV file
 
         Returns:
-            pd.DataFrame:  DataFrame containing the data from the CSV file
+            Motor:  The loaded motor
         """
+        return self.set_motor(load_motor(filepath))
 
-        try:
-            df = pd.read_csv(self.DATA_FILEPATH, delimiter=",", skiprows=6)
-            return df
-        except Exception as e:
-            print(f"An error occurred while reading the CSV file: {e}")
-            return None
-
-    def extract_time(self, text: str) -> float:
-        """Extract the numerical value of time from a string containing 't ='
+    def set_motor(self, motor: Motor) -> Motor:
+        """Set the MOTOR, MOTOR_NAME and AVERAGE_THRUST constants from a motor, e.g. one from a MotorLibrary.
 
         Args:
-            text (str): string containing 't ='
+            motor (Motor):  The motor
 
         Returns:
-            float: numerical value of time or else None
+            Motor:  The motor
         """
-        match = re.search(r"t=([\d\.]+)", text)
-        return float(match.group(1)) if match else None
+        self.MOTOR = motor
+        self.MOTOR_NAME = motor.designation
+        self.AVERAGE_THRUST = motor.average_thrust
+        return motor
 
-    def remove_non_caps(self, text: str) -> str:
-        """Removes all words that are not in all caps from the given text.
+    def set_output_folder_path(self, path: str) -> None:
+        """Set the OUTPUT_FOLDER_PATH constant to the given path.
 
         Args:
-            text (str): The string from which to remove non-uppercase words
+            path (str):  Output folder path
+        """
+        self.OUTPUT_FOLDER_PATH = path
+
+    def read_csv_file(self) -> OpenRocketExport:
+        """Read the CSV file in a single pass, splitting events from numeric rows.
+        Unchanged files are served from the on-disk export cache. In lazy mode the
+        file is opened as a memory-mapped column store instead.
 
         Returns:
-            str: Modified string containing only uppercase words
+            OpenRocketExport:  The numeric columns and event table from the CSV file (a ColumnStore in lazy mode)
         """
-        return " ".join(word for word in text.split() if word.isupper())
+
+        try:
+            if self.LAZY:
+                try:
+                    return open_column_store(self.DATA_FILEPATH)
+                except OSError as e:
+                    print(f"Error writing the column store, reading into memory instead: {e}")
+            return load_openrocket_csv(self.DATA_FILEPATH)
+        except Exception as e:
+            print(f"An error occurred while reading the CSV file: {e}")
+            return None
 
     def extract_comments(self) -> pd.DataFrame:
         """Extracts the comments from the CSV file and returns a DataFrame.
@@ -246,82 +493,50 @@ class Rocket:
         Returns:
             pd.DataFrame:  DataFrame containing the comments from the CSV file
         """
-        df = self.df
-        comments_df = df[df["# Time (s)"].astype(str).str.contains("#")].copy(deep=True)
-        comments_df["Time (s)"] = comments_df["# Time (s)"].apply(
-            lambda x: re.search(r"t=([\d\.]+)", x).group(1)
-            if re.search(r"t=([\d\.]+)", x)
-            else None
-        )
-        comments_df["Time (s)"] = pd.to_numeric(
-            comments_df["Time (s)"], errors="coerce"
-        )
-        comments_df["Event"] = (
-            comments_df["# Time (s)"]
-            .str.replace(r"occurred at t=[\d\.]+ seconds", "")
-            .str.replace("#", "")
-            .str.strip()
-        )
-        # Apply the function to the 'Event' column of your DataFrame
-        comments_df["Event"] = comments_df["Event"].apply(self.remove_non_caps)
-
-        # Rename 'LAUNCH' to 'LAUNCH/IGNITION'
-        comments_df["Event"] = comments_df["Event"].replace(
-            {"LAUNCH": "LAUNCH/IGNITION"}
-        )
-        # Rename 'BURNOUT' to 'BURNOUT/EJECTION_CHARGE'
-        comments_df["Event"] = comments_df["Event"].replace(
-            {"BURNOUT": "BURNOUT/EJECTION_CHARGE"}
-        )
-        # Rename 'GROUND_HIT' to 'GROUND_HIT/SIMULATION_END'
-        comments_df["Event"] = comments_df["Event"].replace(
-            {"GROUND_HIT": "GROUND_HIT/SIMULATION_END"}
-        )
-
-        # Remove the 'IGNITION' row
-        comments_df = comments_df[comments_df["Event"] != "IGNITION"]
-        # Remove the 'EJECTION_CHARGE' row
-        comments_df = comments_df[comments_df["Event"] != "EJECTION_CHARGE"]
-        # Remove the 'SIMULATION_END' row
-        comments_df = comments_df[comments_df["Event"] != "SIMULATION_END"]
-
-        return comments_df[["Time (s)", "Event"]]
+        # Rename paired events such as LAUNCH/IGNITION and drop their duplicates
+        return canonical_events(self.export.events)
 
     def filter_comments_from_csv(self) -> pd.DataFrame:
-        """Filters out rows that contain comments from the dataframe.
+        """Returns the numeric rows of the CSV file, which the parser keeps apart from comments.
 
         Returns:
             pd.DataFrame:  DataFrame containing the filtered data
         """
-        df = self.df.copy(deep=True)
-        filtered_df = df[~df["# Time (s)"].astype(str).str.contains("#")].copy(
-            deep=True
-        )
-        filtered_df["Time (s)"] = pd.to_numeric(
-            filtered_df["# Time (s)"], errors="coerce"
-        )
-        return filtered_df
+        return self.export.to_frame()
 
     def merge_dataframes(self) -> pd.DataFrame:
-        """Merges the filtered DataFrame with the comments DataFrame.
+        """Returns the DataFrame the plots and calculations work on.
+        Events are not stored as a column, the event index keeps their row positions instead.
 
         Returns:
             pd.DataFrame:  DataFrame containing the merged data
         """
+        return self.filtered_df
 
-        merged_df = self.filtered_df.merge(self.comments_df, on="Time (s)", how="left")
-        # Dropping the 'Time (s)' column from the merged DataFrame
-        merged_df.drop(columns=["Time (s)"], inplace=True)
+    def get_columns(self, columns: list) -> pd.DataFrame:
+        """Return only the given columns of the merged data without copying them.
+        In lazy mode only these columns are paged in from the column store.
 
-        # Ensure 'Time (s)' in filtered_df is float, if it's not already
-        merged_df["# Time (s)"] = pd.to_numeric(
-            merged_df["# Time (s)"], errors="coerce"
-        )
+        Args:
+            columns (list):  Column names
 
-        rename_dict = {"# Time (s)": "Time (s)"}
-        merged_df.rename(columns=rename_dict, inplace=True)
+        Returns:
+            pd.DataFrame:  DataFrame containing the requested columns
+        """
+        return self.merged_df[columns]
 
-        return merged_df
+    def column_view(self, column: str) -> np.ndarray:
+        """Return a read-only NumPy view of one column of the merged data, without copying it.
+
+        Args:
+            column (str):  Column name
+
+        Returns:
+            np.ndarray:  Read-only view of the column
+        """
+        view = self.merged_df[column].to_numpy().view()
+        view.flags.writeable = False
+        return view
 
     def find_event_time(self, event_name: str) -> float:
         """Find the time when a specific event occurred.
@@ -332,26 +547,67 @@ class Rocket:
         Returns:
             float: The time when the event occurred or None if the event was not found.
         """
-        event_times = self.merged_df.loc[
-            self.merged_df["Event"] == event_name, "Time (s)"
-        ]
-        return float(event_times.iloc[0]) if not event_times.empty else None
+        return self.event_index.time(event_name)
     
     def find_event_mach(self, event_name: str) -> float:
-        """Find the time when a specific event occurred.
+        """Find the Mach number when a specific event occurred.
 
         Args:
             event_name (str): The name of the event to find
 
         Returns:
-            float: The time when the event occurred or None if the event was not found.
+            float: The Mach number when the event occurred or None if the event was not found.
+        """
+        return self.event_index.mach(event_name)
+
+    def build_event_index(self) -> EventIndex:
+        """Build the index of events from the merged DataFrame.
+
+        Returns:
+            EventIndex:  Row position, time, Mach, altitude and velocity of each event
+        """
+        return EventIndex.from_frame(self.merged_df, self.comments_df, tolerance=self.EVENT_TOLERANCE)
+
+    def events(self) -> pd.DataFrame:
+        """Return every event with the flight state when it occurred.
+
+        Returns:
+            pd.DataFrame:  One row per event with its row position, time, Mach, altitude and velocity
+        """
+        return self.event_index.events()
+
+    def summary(self) -> FlightSummary:
+        """Summarise the flight: apogee, peak velocity, acceleration, Mach and dynamic pressure,
+        stability margins and the flight state at key events.
+
+        Summaries are memoised per dataset, so repeated calls on unchanged data are free.
+
+        Returns:
+            FlightSummary:  Key numbers of the flight
         """
-        event_times = self.merged_df.loc[
-            self.merged_df["Event"] == event_name, "Mach number (​)"
-        ]
-        return float(event_times.iloc[0]) if not event_times.empty else None
+        return summarise_flight(self.merged_df, self.event_index, key=(self.dataset_key, self.EVENT_TOLERANCE))
 
 
+    def decimate_series(self, ax, x: np.ndarray, y: np.ndarray, x_range: tuple = None) -> tuple:
+        """Reduce a series to the pixel width of the axes it is drawn on, keeping its peaks.
+
+        Args:
+            ax (matplotlib.axes.Axes): The Axes object the series is plotted on
+            x (np.ndarray): Sample positions, sorted in ascending order
+            y (np.ndarray): Series values
+            x_range (tuple, optional): Visible (min, max) of x if the axes are zoomed in. Defaults to the full series.
+
+        Returns:
+            tuple: (x, y) of the samples to plot
+        """
+        buckets = ax.bbox.width
+        if x_range is not None and len(x) > 1:
+            # Keep the resolution of the visible window when only part of the series is shown
+            visible = x_range[1] - x_range[0]
+            if visible > 0:
+                buckets *= max((np.nanmax(x) - np.nanmin(x)) / visible, 1)
+        return decimate(x, y, buckets, self.DECIMATION_MODE, self.DECIMATION_THRESHOLD)
+
     def plot_event_markers(self, ax):
             """Plot event markers on the provided Axes object.
 
@@ -395,19 +651,26 @@ class Rocket:
                         rotation=90, verticalalignment='top', horizontalalignment='right', color='red', fontsize=8)
 
                     
-    def plot_Flight_Profile(self):
-        """Plot the Flight Profile data."""
-        df = self.merged_df.copy(deep=True)
+    def draw_Flight_Profile(self, fig) -> None:
+        """Draw the Flight Profile data onto a figure.
+
+        Args:
+            fig (matplotlib.figure.Figure): Empty figure to draw on
+        """
+        time = self.column_view("Time (s)")
+        altitude = self.column_view("Altitude (ft)")
+        velocity = self.column_view("Vertical velocity (m/s)")
+        acceleration = self.column_view("Vertical acceleration (m/s²)")
         # Calculate maximum and minimum values for plotting
         max_altitude = (
-            math.ceil(df["Altitude (ft)"].max() / self.ALTITUDE_INCREMENTS)
+            math.ceil(np.nanmax(altitude) / self.ALTITUDE_INCREMENTS)
             * self.ALTITUDE_INCREMENTS
         )
         max_vertical_motion = (
             math.ceil(
                 max(
-                    df["Vertical velocity (m/s)"].max(),
-                    df["Vertical acceleration (m/s²)"].max(),
+                    np.nanmax(velocity),
+                    np.nanmax(acceleration),
                 )
                 / self.VERTICAL_MOTION_INCREMENTS
             )
@@ -416,8 +679,8 @@ class Rocket:
         min_vertical_motion = (
             math.floor(
                 min(
-                    df["Vertical velocity (m/s)"].min(),
-                    df["Vertical acceleration (m/s²)"].min(),
+                    np.nanmin(velocity),
+                    np.nanmin(acceleration),
                 )
                 / self.VERTICAL_MOTION_INCREMENTS
             )
@@ -425,30 +688,28 @@ class Rocket:
         )
 
         # Create plot
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        ax1 = fig.subplots()
 
         # Plot Altitude
-        ax1.plot(df["Time (s)"], df["Altitude (ft)"], "k:", label="Altitude (ft)")
+        ax1.plot(*self.decimate_series(ax1, time, altitude), "k:", label="Altitude (ft)")
         ax1.set_xlabel("TIME (s)")
         ax1.set_ylabel("ALTITUDE (ft)")
-        ax1.set_xlim(0, df["Time (s)"].max())
+        ax1.set_xlim(0, np.nanmax(time))
         ax1.set_ylim(0, max_altitude)
         ax1.set_yticks(range(0, max_altitude + 1, self.ALTITUDE_INCREMENTS))
         # Set x-axis ticks at regular intervals
-        ax1.set_xticks(np.arange(0, df["Time (s)"].max(), 10))
+        ax1.set_xticks(np.arange(0, np.nanmax(time), 10))
         ax1.grid(True)
 
         # Plot Vertical velocity and acceleration
         ax2 = ax1.twinx()
         ax2.plot(
-            df["Time (s)"],
-            df["Vertical velocity (m/s)"],
+            *self.decimate_series(ax2, time, velocity),
             "k--",
             label="Vertical velocity (m/s)",
         )
         ax2.plot(
-            df["Time (s)"],
-            df["Vertical acceleration (m/s²)"],
+            *self.decimate_series(ax2, time, acceleration),
             "k-",
             label="Vertical acceleration (m/s²)",
         )
@@ -469,39 +730,46 @@ class Rocket:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="upper right")
 
-        plt.title(f"{self.MOTOR_NAME} Motor - Vertical Motion vs Time")
+        ax2.set_title(f"{self.MOTOR_NAME} Motor - Vertical Motion vs Time")
         fig.tight_layout()
 
         # Plot event markers
         self.plot_event_markers(ax1)
+     
+    def draw_Stability(self, fig) -> None:
+        """Draw Stability data onto a figure.
 
-        # plt.show()
+        Args:
+            fig (matplotlib.figure.Figure): Empty figure to draw on
+        """
+        time = self.column_view("Time (s)")
+        cp_location = self.column_view("CP location (mm)")
+        cg_location = self.column_view("CG location (mm)")
 
-        # Save plot if required
-        if self.PLOT_SAVE:
-            # filename = "/Flight_Profile.png"
-            # fig.savefig(self.OUTPUT_FOLDER_PATH + filename)
-            return self.save_plot(fig, 'Flight_Profile.png')
-     
-    def plot_Stability(self) -> None:
-        """Plot Stability data."""
-        df = self.merged_df.copy(deep=True)
+        # Select stability data based on STABILITY_UNIT, computing the percentage into a scratch buffer
+        if self.STABILITY_UNIT == 'cal':
+            stability = self.column_view("Stability margin calibers ()")
+        else:
+            stability = np.subtract(cp_location, cg_location)
+            stability /= self.ROCKET_LENGTH
+            stability *= 100
 
-        # Calculate stability margin percentage if needed
-        if self.STABILITY_UNIT == '%':
-            df["stability margin percentage"] = (
-                (df["CP location (mm)"] - df["CG location (mm)"])
-                / self.ROCKET_LENGTH * 100
-            )
+        # Set x-axis limits based on SHOW_FULL_STABILITY_GRAPH
+        if self.SHOW_FULL_STABILITY_GRAPH:
+            x_range = (0, np.nanmax(time))
+        else:
+            burnout_time = self.find_event_time("BURNOUT/EJECTION_CHARGE")
+            # Exports without a burnout event show the whole flight
+            x_range = (0, np.nanmax(time) if burnout_time is None else burnout_time)
 
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+        ax1 = fig.subplots()
 
         # Select y-axis data based on STABILITY_UNIT and plot
         if self.STABILITY_UNIT == 'cal':
-            ax1.plot(df["Time (s)"], df["Stability margin calibers (​)"], "k-", label="Stability(cal)")
+            ax1.plot(*self.decimate_series(ax1, time, stability, x_range), "k-", label="Stability(cal)")
             y_label = "STABILITY (cal)"
         else:
-            ax1.plot(df["Time (s)"], df["stability margin percentage"], "k-", label="Stability(%)")
+            ax1.plot(*self.decimate_series(ax1, time, stability, x_range), "k-", label="Stability(%)")
             y_label = "STABILITY (%)"
 
         ax1.set_xlabel("TIME (s)")
@@ -510,16 +778,11 @@ class Rocket:
 
         # Plot CP and CG location on a secondary axis
         ax2 = ax1.twinx()
-        ax2.plot(df["Time (s)"], df["CP location (mm)"], "r--", label="CP location (mm)")
-        ax2.plot(df["Time (s)"], df["CG location (mm)"], "b--", label="CG location (mm)")
+        ax2.plot(*self.decimate_series(ax2, time, cp_location, x_range), "r--", label="CP location (mm)")
+        ax2.plot(*self.decimate_series(ax2, time, cg_location, x_range), "b--", label="CG location (mm)")
         ax2.set_ylabel("LOCATION (mm)")
 
-        # Set x-axis limits based on SHOW_FULL_STABILITY_GRAPH
-        if self.SHOW_FULL_STABILITY_GRAPH:
-            ax1.set_xlim(0, df["Time (s)"].max())
-        else:
-            burnout_time = self.find_event_time("BURNOUT/EJECTION_CHARGE")
-            ax1.set_xlim(0, burnout_time)
+        ax1.set_xlim(*x_range)
 
         # Combine legends from ax1 and ax2
         lines, labels = ax1.get_legend_handles_labels()
@@ -529,29 +792,29 @@ class Rocket:
         # Plot event markers
         self.plot_event_markers(ax1)
         
-        plt.title(f"{self.MOTOR_NAME} Motor - {y_label} vs Time(s)")
-        plt.show()
-
-        # Save plot if required
-        if self.PLOT_SAVE:
-            filename = "/Stability.png"
-            fig.savefig(self.OUTPUT_FOLDER_PATH + filename)
+        ax2.set_title(f"{self.MOTOR_NAME} Motor - {y_label} vs Time(s)")
     
-    def plot_DragCoefficient(self)->None:
-        df = self.merged_df.copy(deep=True)
-        fig, ax1 = plt.subplots(figsize=(12, 6))
+    def draw_DragCoefficient(self, fig) -> None:
+        """Draw the drag coefficient against Mach number onto a figure.
+
+        Args:
+            fig (matplotlib.figure.Figure): Empty figure to draw on
+        """
+        mach = self.column_view("Mach number ()")
+        drag = self.column_view("Drag coefficient ()")
+        ax1 = fig.subplots()
         
         ax1.set_xlabel("Mach")
         ax1.set_ylabel("Drag Coefficient")
         ax1.grid(True)
-        ax1.scatter(df["Mach number (​)"], df["Drag coefficient (​)"], color='k', s=5, label="Drag Coefficient")
+        ax1.scatter(mach, drag, color='k', s=5, label="Drag Coefficient")
        
-        max_drag = math.ceil(df["Drag coefficient (​)"].max() * 10) / 10
-        max_mach = math.ceil(df["Mach number (​)"].max() * 10) / 10
+        max_drag = math.ceil(np.nanmax(drag) * 10) / 10
+        max_mach = math.ceil(np.nanmax(mach) * 10) / 10
         
         # Find the data range for the drag coefficient
-        min_drag_coefficient = df["Drag coefficient (​)"].min()
-        max_drag_coefficient = df["Drag coefficient (​)"].max()
+        min_drag_coefficient = np.nanmin(drag)
+        max_drag_coefficient = np.nanmax(drag)
 
         # Add a buffer to the min and max
         buffer = (max_drag_coefficient - min_drag_coefficient) * 0.1  # 10% buffer
@@ -571,10 +834,91 @@ class Rocket:
         
         # Plot event markers
         self.plot_event_markers_mach(ax1)
-        
-        plt.show()
+
             
 
+    def plot_Flight_Profile(self):
+        """Plot the Flight Profile data."""
+        # Save plot if required, repeat requests are served from the plot cache without drawing
+        if self.PLOT_SAVE:
+            return self.save_plot('Flight_Profile')
+
+        with figure() as fig:
+            self.draw_Flight_Profile(fig)
+
+    def plot_Stability(self):
+        """Plot Stability data."""
+        # Save plot if required, repeat requests are served from the plot cache without drawing
+        if self.PLOT_SAVE:
+            return self.save_plot('Stability')
+
+        with figure() as fig:
+            self.draw_Stability(fig)
+
+    def plot_DragCoefficient(self) -> None:
+        """Plot the drag coefficient against Mach number."""
+        with figure() as fig:
+            self.draw_DragCoefficient(fig)
+
+    def render_plot(self, plot: str, format: str = "png", dpi: float = None) -> bytes:
+        """Render one plot into memory on a private figure, without pyplot.
+
+        Args:
+            plot (str): 'Flight_Profile', 'Stability' or 'DragCoefficient'
+            format (str, optional): Image format, e.g. 'png' or 'svg'. Defaults to 'png'.
+            dpi (float, optional): Resolution. Defaults to the figure dpi.
+
+        Returns:
+            bytes: The encoded image
+        """
+        return default_renderer.render(self._drawer(plot), format, dpi)
+
+    def render_plots(self, plots: list = PLOTS, format: str = "png", dpi: float = None) -> dict:
+        """Render several plots at once on the shared render threads.
+
+        Args:
+            plots (list, optional): Names of the plots to render. Defaults to every plot.
+            format (str, optional): Image format, e.g. 'png' or 'svg'. Defaults to 'png'.
+            dpi (float, optional): Resolution. Defaults to the figure dpi.
+
+        Returns:
+            dict: Plot name to the encoded image
+        """
+        draws = {plot: self._drawer(plot) for plot in plots}
+        # Build the shared frames once up front rather than racing to build them in every thread
+        self.event_index
+        return default_renderer.render_many(draws, format, dpi)
+
+    def render_report(self, plots: list = PLOTS, output_path: str = None, format: str = "pdf",
+                      workers: int = None) -> Report:
+        """Render several plots in parallel on the loaded data and write them as one report.
+
+        Args:
+            plots (list, optional): Names of the plots to include. Defaults to every plot.
+            output_path (str, optional): PDF file, or directory for a 'png' or 'svg' set.
+                Defaults to 'Report.pdf' or 'Report' in OUTPUT_FOLDER_PATH.
+            format (str, optional): 'pdf', 'png' or 'svg'. Defaults to 'pdf'.
+            workers (int, optional): Number of render threads. Defaults to the shared renderer, one thread per CPU.
+
+        Returns:
+            Report: The files written and the draw and write time of each plot
+        """
+        draws = {plot: self._drawer(plot) for plot in plots}
+        if output_path is None:
+            output_path = os.path.join(self.OUTPUT_FOLDER_PATH, "Report.pdf" if format == "pdf" else "Report")
+        # Build the shared frames once up front rather than racing to build them in every thread
+        self.event_index
+        if workers is None:
+            return render_report(draws, output_path, format)
+        with PlotRenderer(workers) as renderer:
+            return render_report(draws, output_path, format, renderer)
+
+    def _drawer(self, plot: str):
+        """Return the draw method of a plot by name."""
+        if plot not in PLOTS:
+            raise ValueError(f"Invalid plot '{plot}'. Please choose one of {', '.join(PLOTS)}.")
+        return getattr(self, "draw_" + plot)
+
     def run(self):
         flight_profile_url = self.plot_Flight_Profile()
         # self.plot_Stability()